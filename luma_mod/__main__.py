@@ -22,6 +22,9 @@ def _dependency_warnings() -> None:
 
 
 def main() -> int:
+    # RAG indexing spawns text-extraction processes; frozen builds must hand those off here
+    import multiprocessing
+    multiprocessing.freeze_support()
     _prime_environment()
     _dependency_warnings()
 
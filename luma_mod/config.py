@@ -25,3 +25,23 @@ def get_default_ai_mode() -> str:
     return mode
 
 
+def get_rag_index_kind() -> str:
+    """Return the FAISS index type used when a new RAG index is created.
+
+    Environment variable: LUMA_RAG_INDEX (values: flat|hnsw|sq8)
+    Defaults to "flat" (exact search); "sq8" stores 8-bit quantized vectors.
+    An existing index keeps its type; rebuild it (replace) to switch.
+    """
+    kind = (os.getenv("LUMA_RAG_INDEX") or "flat").strip().lower()
+    if kind not in {"flat", "hnsw", "sq8"}:
+        return "flat"
+    return kind
+
+
+def get_faiss_gpu_enabled() -> bool:
+    """Return whether RAG queries may run the FAISS index on a GPU.
+
+    Environment variable: LUMA_FAISS_GPU (1/true/yes to enable)
+    Defaults to off; also needs a GPU build of FAISS and a visible CUDA device.
+    """
+    return (os.getenv("LUMA_FAISS_GPU") or "").strip().lower() in {"1", "true", "yes"}
@@ -5,36 +5,68 @@ from typing import Dict, Any
 from PyQt6.QtCore import QLocale, QTranslator, QCoreApplication
 from PyQt6.QtWidgets import QApplication
 
+# Display names in the order they are offered in the settings page
+LANGUAGE_NAMES: Dict[str, str] = {
+    "en": "English",
+    "es": "Español",
+    "fr": "Français",
+    "de": "Deutsch",
+    "zh": "中文",
+    "ja": "日本語",
+}
+
+
 class TranslationManager:
     """Manages translations and language switching for the application."""
     
     def __init__(self):
         self.current_language = "en"
         self.translations: Dict[str, Dict[str, str]] = {}
+        self.translations_dir = os.path.join(os.path.dirname(__file__), "translations")
         self.translator = QTranslator()
+        # Results of argument-less translate() calls for the current language
+        self._memo: Dict[str, Any] = {}
         self.load_translations()
     
     def load_translations(self):
-        """Load all available translations from the translations directory."""
-        translations_dir = os.path.join(os.path.dirname(__file__), "translations")
-        
-        if not os.path.exists(translations_dir):
-            os.makedirs(translations_dir)
+        """Load the fallback (English) and current language catalogs.
+
+        Other catalogs are loaded on demand by `set_language`.
+        """
+        if not os.path.exists(self.translations_dir):
+            os.makedirs(self.translations_dir)
             self._create_default_translations()
         
-        for filename in os.listdir(translations_dir):
-            if filename.endswith('.json'):
-                lang_code = filename[:-5]  # Remove .json extension
-                filepath = os.path.join(translations_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        self.translations[lang_code] = json.load(f)
-                except Exception as e:
-                    print(f"Failed to load translation {lang_code}: {e}")
+        # Enumerate catalogs once; only file names are needed here
+        on_disk = {f[:-5] for f in os.listdir(self.translations_dir) if f.endswith('.json')}
+        self._available = tuple(
+            [code for code in LANGUAGE_NAMES if code in on_disk]
+            + sorted(on_disk.difference(LANGUAGE_NAMES))
+        )
+        self._ensure_loaded("en")
+        self._ensure_loaded(self.current_language)
+    
+    def _path_for(self, lang_code: str) -> str:
+        return os.path.join(self.translations_dir, f"{lang_code}.json")
+    
+    def _ensure_loaded(self, lang_code: str) -> bool:
+        """Load a language catalog from disk if it is not resident yet."""
+        if lang_code in self.translations:
+            return True
+        if lang_code not in self._available:
+            return False
+        filepath = self._path_for(lang_code)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                self.translations[lang_code] = json.load(f)
+            return True
+        except Exception as e:
+            print(f"Failed to load translation {lang_code}: {e}")
+            return False
     
     def _create_default_translations(self):
         """Create default translation files for major languages."""
-        translations_dir = os.path.join(os.path.dirname(__file__), "translations")
+        translations_dir = self.translations_dir
         
         # English (default)
         en_translations = {
@@ -269,24 +301,29 @@ class TranslationManager:
     
     def get_available_languages(self) -> Dict[str, str]:
         """Get available languages with their display names."""
-        return {
-            "en": "English",
-            "es": "Español",
-            "fr": "Français",
-            "de": "Deutsch",
-            "zh": "中文",
-            "ja": "日本語"
-        }
+        return {code: LANGUAGE_NAMES.get(code, code) for code in self._available}
     
     def set_language(self, lang_code: str):
-        """Set the current language."""
-        if lang_code in self.translations:
+        """Set the current language, loading its catalog on first use."""
+        if self._ensure_loaded(lang_code):
+            if lang_code != self.current_language:
+                self._memo.clear()
             self.current_language = lang_code
             return True
         return False
     
     def translate(self, key: str, **kwargs) -> str:
         """Get translated text for a key."""
+        if kwargs:
+            return self._translate(key, **kwargs)
+        # UI refreshes ask for the same handful of keys over and over
+        try:
+            return self._memo[key]
+        except KeyError:
+            text = self._memo[key] = self._translate(key)
+            return text
+
+    def _translate(self, key: str, **kwargs) -> str:
         if self.current_language in self.translations:
             translation = self.translations[self.current_language].get(key, key)
         else:
@@ -1,18 +1,24 @@
 from __future__ import annotations
 import os
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
 from typing import Optional, List
+from urllib.parse import quote, unquote, parse_qs
 
-from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtCore import Qt, QTimer, QUrl, QSize, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QFrame, QLineEdit, QComboBox, QListView, QVBoxLayout, QHBoxLayout, QSplitter, QSizePolicy, QTextEdit, QPushButton, QLabel, QStackedLayout, QTextBrowser, QFileDialog, QDialog, QListWidget, QDialogButtonBox, QProgressDialog
-from PyQt6.QtGui import QTextCursor, QMouseEvent, QKeyEvent, QGuiApplication
+from PyQt6.QtGui import QTextCursor, QTextDocument, QMouseEvent, QKeyEvent, QGuiApplication, QIcon
 
 from .utils import DEFAULT_FOLDERS, FILETYPE_MAP, divider, center_on_screen, os_open, make_paths_clickable
 from .widgets import BusySpinner, ToggleSwitch, PreviewPane, LoadingOverlay
 from .models import ResultsModel, ResultDelegate, FileHit
 from .ai import LumaAI
 from .search_core import search_files
+from .rag.query import search as rag_search
 from .i18n import get_translation_manager, tr
-from .ui.chat_browser import ChatBrowser
+from .ui.chat_browser import ChatBrowser, glyph_img
 from .ui.workers import (
     SearchWorker,
     AIWorker,
@@ -25,6 +31,365 @@ from .ui.workers import (
 from .config import get_openai_api_key, get_default_ai_mode
 
 
+# Recent search results, keyed by the full set of search parameters
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_TTL = 60.0  # seconds
+# Recent AI rerank outputs, keyed by query, input hits and guardrails (cleared on mode change)
+RERANK_CACHE_SIZE = 32
+# Queries shorter than this are not searched while typing (Enter still searches)
+MIN_AUTO_SEARCH_CHARS = 2
+
+# Upper bound on cached path splits used by _conditioned_rerank (cleared when exceeded)
+HIT_PARTS_CACHE_SIZE = 4096
+
+# Rows rendered per chunk of a chat results turn; the rest load from a "Show more" link
+CHAT_RESULT_ROWS = 20
+
+# Oldest chat blocks are dropped past this; a 50-hit results turn is ~150 blocks
+CHAT_MAX_BLOCKS = 3000
+
+LOGO_PATH = os.path.join(os.path.dirname(__file__), "..", "IMG", "logo3.png")
+
+# Keywords that only name the folder scope; dropped once folders are resolved
+_FOLDER_TOKENS = frozenset({"folder", "folders", "dir", "directory"})
+# Query routing patterns, compiled once at import
+_RE_PPT = re.compile(r"\b(pptx?|power\s*point|powerpoint)\b", re.IGNORECASE)
+_RE_LIST_INTENT = re.compile(r"\b(show|list|open)\b.*\b(folder|directory|under|in)\b", re.IGNORECASE)
+_RE_RAG_INTENT = re.compile(r"\b(summary|summar(ize|ise)|what\b|which\b)", re.IGNORECASE)
+
+
+def _path_parts(path: str) -> tuple:
+    """(ext, parent dir, basename, parent name, display name); all but the dir and name lowercased."""
+    parent_dir = os.path.dirname(path)
+    name = os.path.basename(path)
+    return (
+        os.path.splitext(path)[1].lower(),
+        parent_dir,
+        name.lower(),
+        os.path.basename(parent_dir).lower(),
+        name,
+    )
+
+
+# Chat bubble templates (%-formatted with turn, ts and msg; literal percent signs are doubled)
+_USER_CARD_HTML = """
+        <div id='qa-%(turn)s' style='background:#ffffff; border:1px solid #e5e7eb; border-radius:16px; padding:14px 16px; margin:12px 0; box-shadow: 0 1px 4px rgba(0,0,0,0.05);'>
+            <div style='margin-bottom: 10px; display: flex; justify-content: flex-end;'>
+                <div style='background: #3b82f6; color: white; border-radius: 12px; padding: 10px 14px; max-width: 88%%; box-shadow: 0 1px 3px rgba(0,0,0,0.1);'>
+                    <div style='display: flex; align-items: center; margin-bottom: 4px;'>
+                        <span style='background:#1d4ed8; color:#fff; border-radius:8px; font-size:11px; padding:2px 6px; margin-right:8px;'>#%(turn)s</span>
+                        <span style='font-weight: 600;'>You</span>
+                        <span style='color: rgba(255,255,255,0.85); font-size: 12px; margin-left: 8px;'>%(ts)s</span>
+                    </div>
+                    <div style='color: #ffffff;'>%(msg)s</div>
+                </div>
+            </div>
+        </div>
+        """
+
+_AI_BUBBLE_HTML = """
+        <div style='display: flex; justify-content: flex-start;'>
+            <div style='background: #f8fafc; border: 1px solid #e2e8f0; border-radius: 12px; padding: 12px 16px; max-width: 88%%; box-shadow: 0 1px 3px rgba(0,0,0,0.06);'>
+                <div style='display: flex; align-items: center; margin-bottom: 8px;'>
+                    <div style='width: 8px; height: 8px; background: #3b82f6; border-radius: 50%%; margin-right: 8px;'></div>
+                    <span style='background:#e0e7ff; color:#1e293b; border-radius:8px; font-size:11px; padding:2px 6px; margin-right:8px;'>#%(turn)s</span>
+                    <span style='font-weight: 600; color: #1e293b;'>AI</span>
+                    <span style='color: #64748b; font-size: 12px; margin-left: 8px;'>%(ts)s</span>
+                </div>
+                <div style='color: #1e293b;'>%(msg)s</div>
+            </div>
+        </div>
+        """
+
+# AI turn with a file list: opening (%-formatted with ts and msg) and closing halves around the rows
+_RESULTS_BUBBLE_OPEN_HTML = """
+        <div style='margin-bottom: 16px; display: flex; justify-content: flex-start;'>
+            <div style='background: #f8fafc; border: 1px solid #e2e8f0; border-radius: 12px; padding: 12px 16px; max-width: 80%%; box-shadow: 0 1px 3px rgba(0,0,0,0.1);'>
+                <div style='display: flex; align-items: center; margin-bottom: 8px;'>
+                    <div style='width: 8px; height: 8px; background: #3b82f6; border-radius: 50%%; margin-right: 8px;'></div>
+                    <span style='font-weight: 600; color: #1e293b;'>AI</span>
+                    <span style='color: #64748b; font-size: 12px; margin-left: 8px;'>%(ts)s</span>
+                </div>
+                <div style='color: #1e293b; margin-bottom: 12px;'>%(msg)s</div>
+                <div style='background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08); border: 1px solid rgba(0,0,0,0.08); padding: 0px; margin-top: 8px;'>
+        """
+_RESULTS_BUBBLE_CLOSE_HTML = """
+                </div>
+            </div>
+        </div>
+        """
+
+# One row of an AI results turn (%-formatted with href, icon, name, path and meta).
+# Keep to properties QTextDocument understands; flex layout, hover handlers, transitions
+# and cursor hints were parsed for every row and then thrown away.
+_RESULT_ROW_HTML = """
+        <div style='padding: 8px 8px 8px 24px; margin: 3px 0px 3px 0px; border-radius: 12px;'>
+            <a href="luma://select?path=%(href)s" style='text-decoration: none; color: inherit;'>
+                <div style='width: 16px; height: 16px; margin-right: 12px; font-size: 12px;'>%(icon)s</div>
+                <div>
+                    <div style='font-weight: 600; color: #1e293b; font-size: 14px; margin-bottom: 2px;'>%(name)s</div>
+                    <div style='font-size: 12px; color: #64748b;'>%(path)s  •  %(meta)s</div>
+                </div>
+            </a>
+            </div>
+            """
+
+# Trailing link of a partially rendered results turn (%-formatted with turn and count)
+_SHOW_MORE_HTML = (
+    "<div style='padding: 6px 8px 8px 24px;'><a href='luma://expand?turn=%(turn)s' "
+    "style='color:#3b82f6; text-decoration:none; font-size:12px;'>Show %(count)s more…</a></div>"
+)
+
+_ASK_PLACEHOLDER_HTML = """
+        <div style="display: flex; align-items: center; justify-content: center; height: 100%; min-height: 300px;">
+            <div style="text-align: center;">
+                <div style="font-size: 24px; font-weight: 600; color: #1e293b; margin-bottom: 8px;">Ask Anything</div>
+            </div>
+        </div>
+        """
+# Transient status line appended while the AI works (removed again by _clear_thinking_line)
+_THINKING_TEXT = "AI is thinking…"
+_THINKING_LINE = _THINKING_TEXT + "\n"
+
+# Flattens snippet whitespace so each citation renders on one line
+_NL_TO_SPACE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+# RAG citation snippets (%-formatted; literal percent signs are doubled)
+_RAG_CARD_HTML = (
+    "<div style='border:1px solid #e5e7eb; border-radius:10px; padding:10px; margin:8px 20%% 8px 0;'>"
+    "<div style='font-weight:600; margin-bottom:6px;'>[%d] %s</div>"
+    "<div style='color:#374151; font-size:0.95em;'>%s</div>"
+    "</div>"
+)
+_RAG_SOURCES_HEADER_HTML = "<div style='margin:8px 0 4px 0; color:#6b7280; font-weight:600;'>Sources</div>"
+_RAG_SOURCE_HTML = (
+    "<div style='border:1px solid #e5e7eb; border-radius:10px; padding:10px; margin:6px 20%% 6px 0;'>"
+    "<div style='display:flex; justify-content:space-between; align-items:center; margin-bottom:6px;'>"
+    "<div style='font-weight:600;'>[%d] %s</div>"
+    "<div>"
+    "<a href='luma://select?path=%s' style='margin-right:8px;'>Preview</a>"
+    "<a href='luma://select?path=%s' onclick='return false;' style='margin-right:0;'>Open</a>"
+    "</div>"
+    "</div>"
+    "<div style='color:#374151; font-size:0.95em;'>%s</div>"
+    "</div>"
+)
+_RAG_LOW_CONFIDENCE_HTML = (
+    "<div style='background:#fef3c7; color:#92400e; padding:10px; border-radius:10px; border-left:4px solid #f59e0b; margin:8px 20% 0 0;'>Not enough info in your files</div>"
+)
+
+# Indexed by _format_file_size's bit-length bucket
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+# Chat result rows: extension -> emoji icon (anything unlisted gets the generic page)
+_DEFAULT_FILE_ICON = "📄"
+_EXT_ICON = {
+    ".pdf": "📄",
+    **dict.fromkeys((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"), "🖼️"),
+    ".py": "🐍",
+    **dict.fromkeys((".js", ".ts", ".jsx", ".tsx"), "⚛️"),
+    **dict.fromkeys((".html", ".css"), "🌐"),
+    **dict.fromkeys((".doc", ".docx"), "📝"),
+    **dict.fromkeys((".xls", ".xlsx"), "📊"),
+    ".json": "📋",
+    **dict.fromkeys((".h", ".cpp", ".c"), "⚙️"),
+    ".xcscheme": "🔧",
+}
+
+# Qt enum members bound once; PyQt6 scoped enums cost a chain of attribute lookups per use
+_KEEP_ANCHOR = QTextCursor.MoveMode.KeepAnchor
+_SCROLL_TOP = QListView.ScrollHint.PositionAtTop
+_FIND_BACKWARD = QTextDocument.FindFlag.FindBackward
+
+# Dropdown label -> (ai_mode, opens the conversation page)
+_MODE_CONFIG = {
+    "No AI": ("none", False),
+    "Private Mode": ("private", True),
+    "Cloud Mode": ("cloud", True),
+}
+
+# Conversation header mode indicator: ai_mode -> (label, stylesheet)
+_MODE_INDICATOR = {
+    "private": ("🔒 Private Mode", "color: #10b981; font-weight: 500;"),
+    "cloud": ("☁️ Cloud Mode", "color: #3b82f6; font-weight: 500;"),
+    "none": ("No AI", "color: #6b7280; font-weight: 500;"),
+}
+
+# Window stylesheet, built once at import and shared by every SpotlightUI.
+SPOTLIGHT_QSS = """
+        QWidget#wrapper {background: white; border-radius: 16px; border: none;}
+        QWidget {background: transparent;}
+        
+        /* Integrated search container */
+        QWidget#searchContainer {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
+        
+        /* Main search input */
+        QLineEdit#mainSearch {background: transparent; border: none; padding: 8px 12px; color: #111; selection-background-color: #bcd4ff; font-size: 16px; font-weight: 400;}
+        QLineEdit#mainSearch:focus {background: transparent;}
+        
+        /* AI mode button */
+        QPushButton#aiModeButton {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1); padding: 8px 12px; color: #666; font-size: 13px; font-weight: 500;}
+        QPushButton#aiModeButton:hover {background: rgba(0,0,0,0.05); color: #333;}
+        QPushButton#aiModeButton:pressed {background: rgba(0,0,0,0.1);}
+        
+        /* Spinner holder (replaces Tab button) */
+        QWidget#spinnerHolder {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1);}
+        
+        /* Settings button */
+        QPushButton#settingsButton {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1); padding: 8px; color: #666; font-size: 16px; font-weight: 500;}
+        QPushButton#settingsButton:hover {background: rgba(0,0,0,0.05); color: #333;}
+        QPushButton#settingsButton:pressed {background: rgba(0,0,0,0.1);}
+        QPushButton#settingsButton QIcon {background: transparent;}
+        
+        /* AI dropdown menu - popup window style */
+        QWidget#aiDropdown {background: rgba(45, 55, 72, 0.95); border: 1px solid rgba(255,255,255,0.1); border-radius: 12px; box-shadow: 0 10px 25px rgba(0,0,0,0.3);}
+        
+        /* Dropdown options - dark popup style */
+        QPushButton#dropdownOption {background: rgba(255, 255, 255, 0.1); border: 1px solid rgba(255,255,255,0.1); padding: 12px 16px; color: #e5e7eb; font-size: 14px; font-weight: 500; text-align: left; border-radius: 8px; margin: 3px;}
+        QPushButton#dropdownOption:hover {background: rgba(59, 130, 246, 0.3); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.5);}
+        QPushButton#dropdownOption:pressed {background: rgba(59, 130, 246, 0.4); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.6);}
+        QPushButton#dropdownOption:checked {background: rgba(59, 130, 246, 0.35); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.55);}
+        
+        /* Settings page styles */
+        QFrame#settingsSection {background: white; border-radius: 12px; border: 1px solid rgba(0,0,0,0.12); box-shadow: 0 4px 12px rgba(0,0,0,0.08); margin: 8px 0px;}
+        QLabel#settingsLabel {color: #333; font-size: 18px; font-weight: 600; margin-bottom: 16px; padding: 12px 0px; margin-top: 16px;}
+        QLabel#settingsDescription {color: #666; font-size: 14px; font-weight: 400; margin-top: 8px; padding: 4px 0px; line-height: 1.4;}
+        QComboBox#settingsCombo {background: white; border: 2px solid rgba(0,0,0,0.15); border-radius: 8px; padding: 12px 16px; color: #333; font-size: 14px; font-weight: 500;}
+        QComboBox#settingsCombo:hover {border-color: rgba(59, 130, 246, 0.6); background: rgba(59, 130, 246, 0.02);}
+        QComboBox#settingsCombo:focus {border-color: #3b82f6; box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.15);}
+        QComboBox#settingsCombo::drop-down {border: none; width: 20px;}
+        QComboBox#settingsCombo::down-arrow {image: none; border: none; width: 0; height: 0; border-left: 5px solid transparent; border-right: 5px solid transparent; border-top: 5px solid #666;}
+        
+        QListView {background: white; border: none; padding: 0px; color: #222; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
+        QWidget#leftPane {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
+        QWidget#previewPane {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
+        QWidget#previewPane QLabel {background: white; color: #222;}
+        QWidget#previewPane QFrame#thumbCard {background: white; border-radius: 8px; border: 1px solid rgba(0,0,0,0.06);}
+        QWidget#previewPane QTextEdit {background: white; border: 1px solid rgba(0,0,0,0.08); border-radius: 8px; padding: 8px; color: #222;}
+        QWidget#previewPane QPushButton {background: #3b82f6; color: white; border: none; border-radius: 8px; padding: 6px 12px; font-weight: 600;}
+        QWidget#previewPane QPushButton:hover {background: #2563eb;}
+        QWidget#previewPane QPushButton:pressed {background: #1d4ed8;}
+        QListView::item {border-radius: 12px; padding: 8px 8px 8px 24px; margin: 3px 0px 3px 0px;}
+        QListView::item:selected {background: rgba(59, 130, 246, 0.08); border: none; border-radius: 12px;}
+        QLabel#metaHeader {color:#4a4a4a; font-size:12px; font-weight:600; margin: 8px 0 4px 0;}
+        QLabel#metaLabel {color:#6f6f6f; font-size:11px;}
+        QLabel#metaValue {color:#111; font-size:11px;}
+        QWidget#rowContainer {border: none; background: white;}
+        QFrame#rowSep {background: rgba(0,0,0,0.08); min-height: 1px; max-height: 1px; margin-top: 6px;}
+        QFrame#thumbCard {background: white; border: none; border-radius: 0px;}
+        QSplitter::handle {background: rgba(0,0,0,0.06);}
+        
+        /* Conversation Mode Styles - Matching Main Page */
+        QWidget#chatHeader {
+            background: transparent;
+            border: none;
+            border-radius: 0px;
+        }
+        
+        QPushButton#chatBackButton {
+            background: transparent;
+            border: none;
+            color: #6b7280;
+            font-size: 18px;
+            font-weight: 600;
+            border-radius: 8px;
+        }
+        QPushButton#chatBackButton:hover {
+            background: rgba(0,0,0,0.05);
+            color: #374151;
+        }
+        QPushButton#chatBackButton:pressed {
+            background: rgba(0,0,0,0.1);
+        }
+        
+        QLabel#chatModeDisplay {
+            background: transparent;
+            border: none;
+            border-left: 1px solid rgba(0,0,0,0.1);
+            color: #6b7280;
+            font-size: 13px;
+            font-weight: 500;
+            padding: 8px 12px;
+            text-align: center;
+            min-width: 140px;
+            line-height: 1.2;
+        }
+
+        QLabel#folderChip {background: rgba(59,130,246,0.08); border: 1px solid rgba(59,130,246,0.25); border-radius: 10px; padding: 4px 8px; color: #1e40af; font-size: 12px; margin-left: 6px; min-height: 24px;}
+        
+        QWidget#chatSpinnerHolder {
+            background: transparent;
+            border: none;
+        }
+        
+        QWidget#conversationWidget {
+            background: #ffffff;
+            border-radius: 0px;
+        }
+        
+        QTextEdit#conversationView {
+            background: #ffffff;
+            border: none;
+            border-radius: 0px;
+            padding: 16px;
+            color: #1e293b;
+            font-size: 14px;
+            line-height: 1.5;
+        }
+        
+        /* Chat bubble styling */
+        QTextEdit#conversationView a {
+            text-decoration: none;
+            color: #3b82f6;
+        }
+        
+        QTextEdit#conversationView a:hover {
+            text-decoration: underline;
+        }
+        
+        /* Button styling within chat */
+        QTextEdit#conversationView button {
+            background: #f1f5f9;
+            border: 1px solid #d1d5db;
+            border-radius: 6px;
+            padding: 4px 8px;
+            font-size: 11px;
+            color: #374151;
+        }
+        
+        QTextEdit#conversationView button:hover {
+            background: #e5e7eb;
+        }
+        
+        QLineEdit#mainChatInput {
+            background: transparent;
+            border: none;
+            padding: 8px 12px;
+            color: #111;
+            selection-background-color: #bcd4ff;
+            font-size: 16px;
+            font-weight: 400;
+        }
+        QLineEdit#mainChatInput:focus {
+            background: transparent;
+        }
+        
+        QWidget#conversationPreview {
+            background: white;
+            border-left: 1px solid rgba(0,0,0,0.08);
+            border-radius: 0px;
+        }
+        
+        QSplitter#conversationSplitter::handle {
+            background: rgba(0,0,0,0.08);
+            width: 1px;
+        }
+        QSplitter#conversationSplitter::handle:hover {
+            background: rgba(59, 130, 246, 0.3);
+        }
+"""
+
+
+
 # ChatBrowser moved to luma_mod.ui.chat_browser
 
 
@@ -38,6 +403,21 @@ from .config import get_openai_api_key, get_default_ai_mode
 
 
 class SpotlightUI(QWidget):
+    # Emitted after the translation manager switches language
+    languageChanged = pyqtSignal()
+    # Flipped once every widget referenced by _update_ui_texts exists
+    _widgets_built = False
+    # Settings button logo, shared by all windows once loaded
+    _logo_icon: Optional[QIcon] = None
+    # Widgets created in __init__; class-level None defaults keep plain "is not None"
+    # checks valid even for code that can run before construction finishes
+    chat_overlay: Optional[LoadingOverlay] = None
+    conversation_preview: Optional[PreviewPane] = None
+    folder_btn: Optional[QPushButton] = None
+    folder_chip: Optional[QLabel] = None
+    chat_folder_btn: Optional[QPushButton] = None
+    chat_folder_chip: Optional[QLabel] = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Luma (Modular)")
@@ -48,12 +428,47 @@ class SpotlightUI(QWidget):
         self._folders=DEFAULT_FOLDERS[:]
         self._turn_idx = 0
         self._rag_folders: List[str] = []
+        # Window geometry last applied by _on_text_changed: True expanded, False collapsed,
+        # None when something else (no-results, chat, settings) has resized it since
+        self._is_expanded: Optional[bool] = None
+        # (folders, label, tooltip) last pushed to the folder chips
+        self._chip_cache: Optional[tuple] = None
+        # AI backends ("private"/"cloud"/...) already warmed up or being warmed
+        self._warmed_modes: set = set()
+        # (start, end) document positions of the "AI is thinking…" line, while it is shown
+        self._thinking_range: Optional[tuple] = None
+        # Hits (plus rerank conditions) currently shown in the No-AI result list
+        self._last_hit_key: Optional[tuple] = None
+        # Hits of chat results turns not rendered yet, by the turn number in their "Show more" link
+        self._pending_expands: dict = {}
+        self._expand_seq = 0
+        # chat_view document revision right after the placeholder was rendered
+        self._placeholder_revision: Optional[int] = None
+        # path -> _path_parts(path), shared by _conditioned_rerank and the chat result rows
+        self._hit_parts: dict = {}
+        # Entries currently shown in the folder dropdown list
+        self._folder_list_known: tuple = ()
+        # Created on first use; None until then (cheaper to test than hasattr)
+        self.no_results_widget: Optional[QWidget] = None
+        # One reusable timer for the delayed AI-dropdown hide (restarted on every leave)
+        self._dropdown_hide_timer = QTimer(self); self._dropdown_hide_timer.setSingleShot(True)
+        self._dropdown_hide_timer.setInterval(200)  # timeout is wired up in _build_ai_dropdown
         self._worker: Optional[SearchWorker]=None
+        self._text_bindings: List[tuple] = []
+        self._result_cache: "OrderedDict[tuple, tuple[float, List[FileHit]]]" = OrderedDict()
+        self._rerank_cache: "OrderedDict[tuple, List[FileHit]]" = OrderedDict()
         self._ai_worker: Optional[AIWorker]=None
+        # Generation tokens: results from a worker whose token is stale are dropped
+        self._search_gen = 0
+        self._ai_gen = 0
+        # Cancelled workers are kept alive here until their thread finishes
+        self._retired_workers: set = set()
         # Initialize AI with environment-configured defaults (no hardcoded secrets)
         self.openai_api_key = get_openai_api_key()
         self.ai_mode = get_default_ai_mode()  # "none", "private", or "cloud"
         self.ai = LumaAI(mode=self.ai_mode, openai_api_key=self.openai_api_key)
+        # Translation manager is a process-wide singleton; resolve it once
+        self._tm = get_translation_manager()
 
         wrapper=QWidget(); wrapper.setObjectName("wrapper")
 
@@ -92,7 +507,7 @@ class SpotlightUI(QWidget):
         self.folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.folder_btn.setFixedWidth(90)
         self.folder_btn.setFixedHeight(36)
-        self.folder_btn.clicked.connect(self._toggle_folder_dropdown)
+        self.folder_btn.clicked.connect(lambda: self._toggle_folder_dropdown(self.folder_btn))
         # Small chip showing current folder scope
         self.folder_chip = QLabel("All folders")
         self.folder_chip.setObjectName("folderChip")
@@ -108,18 +523,8 @@ class SpotlightUI(QWidget):
         self.settings_btn.setToolTip("Settings")
         self.settings_btn.clicked.connect(self._show_settings)
         
-        # Set the custom logo as icon
-        logo_path = os.path.join(os.path.dirname(__file__), "..", "IMG", "logo3.png")
-        if os.path.exists(logo_path):
-            from PyQt6.QtGui import QIcon, QPixmap
-            from PyQt6.QtCore import QSize
-            icon = QIcon(logo_path)
-            self.settings_btn.setIcon(icon)
-            # Set icon size to 24x24 pixels
-            self.settings_btn.setIconSize(QSize(24, 24))
-        else:
-            # Fallback to gear icon if logo not found
-            self.settings_btn.setText("⚙")
+        # Set the custom logo as icon (QIcon created once per process, decoded when painted)
+        self._load_logo_icon()
         
         # Add widgets to search container
         search_layout.addWidget(self.search, 1)
@@ -129,71 +534,10 @@ class SpotlightUI(QWidget):
         search_layout.addWidget(self.folder_chip, 0)
         search_layout.addWidget(self.settings_btn, 0)
         
-        # Create dropdown menu for AI modes as a popup window
-        self.ai_dropdown = QWidget()
-        self.ai_dropdown.setObjectName("aiDropdown")
-        self.ai_dropdown.setVisible(False)
-        self.ai_dropdown.setFixedSize(160, 120)  # Larger size for better visibility
-        self.ai_dropdown.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint | 
-            Qt.WindowType.Popup | 
-            Qt.WindowType.WindowStaysOnTopHint
-        )
-        # Enable popup behavior - can extend outside parent widget
-        
-        dropdown_layout = QVBoxLayout(self.ai_dropdown)
-        dropdown_layout.setContentsMargins(8, 8, 8, 8)
-        dropdown_layout.setSpacing(0)
-        
-        # Create AI mode buttons
-        self.no_ai_btn = QPushButton("No AI")
-        self.no_ai_btn.setObjectName("dropdownOption")
-        self.no_ai_btn.clicked.connect(lambda: self._set_ai_mode("No AI"))
-        
-        self.private_mode_btn = QPushButton("Private Mode")
-        self.private_mode_btn.setObjectName("dropdownOption")
-        self.private_mode_btn.clicked.connect(lambda: self._set_ai_mode("Private Mode"))
-        
-        self.cloud_mode_btn = QPushButton("Cloud Mode")
-        self.cloud_mode_btn.setObjectName("dropdownOption")
-        self.cloud_mode_btn.clicked.connect(lambda: self._set_ai_mode("Cloud Mode"))
-        
-        dropdown_layout.addWidget(self.no_ai_btn)
-        dropdown_layout.addWidget(self.private_mode_btn)
-        dropdown_layout.addWidget(self.cloud_mode_btn)
-        
-        # Quick folder dropdown (lists known folders; allows open dialog)
-        self.folder_dropdown = QWidget()
-        self.folder_dropdown.setObjectName("aiDropdown")
-        self.folder_dropdown.setVisible(False)
-        self.folder_dropdown.setFixedSize(320, 240)
-        self.folder_dropdown.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint | 
-            Qt.WindowType.Popup | 
-            Qt.WindowType.WindowStaysOnTopHint
-        )
-        fd_lay = QVBoxLayout(self.folder_dropdown); fd_lay.setContentsMargins(8,8,8,8); fd_lay.setSpacing(6)
-        self.lbl_folder_hint = QLabel("Choose folders for RAG. Recently used and defaults shown:"); self.lbl_folder_hint.setStyleSheet("color:#e5e7eb; font-size:12px;")
-        fd_lay.addWidget(self.lbl_folder_hint)
-        self.folder_list = QListWidget(); self.folder_list.setSelectionMode(self.folder_list.SelectionMode.ExtendedSelection)
-        fd_lay.addWidget(self.folder_list)
-        row = QHBoxLayout(); self.btn_add_folder = QPushButton("Add…"); self.btn_use_selected = QPushButton("Use"); self.btn_use_all = QPushButton("Use all"); row.addWidget(self.btn_add_folder); row.addStretch(1); row.addWidget(self.btn_use_all); row.addWidget(self.btn_use_selected)
-        fd_lay.addLayout(row)
-        self.btn_add_folder.clicked.connect(self._add_folder_to_list)
-        self.btn_use_selected.clicked.connect(self._apply_selected_folders)
-        self.btn_use_all.clicked.connect(self._apply_all_folders)
-
-        # Reuse the same dropdown for chat header button
-        def _toggle_chat_folder_dropdown():
-            is_visible = self.folder_dropdown.isVisible()
-            if is_visible:
-                self.folder_dropdown.setVisible(False)
-            else:
-                g = self.chat_folder_btn.mapToGlobal(self.chat_folder_btn.rect().bottomLeft())
-                self.folder_dropdown.move(g.x(), g.y() + 4)
-                self._update_ui_texts()
-                self.folder_dropdown.setVisible(True)
-        self._toggle_folder_dropdown_chat = _toggle_chat_folder_dropdown
+        # Popups and the settings page are built on first use
+        self.ai_dropdown: Optional[QWidget] = None
+        self.folder_dropdown: Optional[QWidget] = None
+        self.settings_page: Optional[QWidget] = None
         
         # Spinner for loading states (now in the spinner holder)
         self.spinner = BusySpinner(16)  # Slightly smaller for the compact space
@@ -215,15 +559,16 @@ class SpotlightUI(QWidget):
         self.ai_mode_button.clicked.connect(self._toggle_ai_dropdown)
         # Remove hover events from button - only click should show dropdown
         
-        # Add hover events to the dropdown itself to keep it open when hovering over it
-        self.ai_dropdown.enterEvent = self._on_dropdown_hover
-        self.ai_dropdown.leaveEvent = self._on_dropdown_leave
 
         self.model=ResultsModel(); self.list=QListView(); self.list.setModel(self.model)
         self.list.setItemDelegate(ResultDelegate()); self.list.setUniformItemSizes(True)
         self.list.setSelectionMode(QListView.SelectionMode.SingleSelection)
         self.list.doubleClicked.connect(self._open_selected)
-        self.list.selectionModel().selectionChanged.connect(self._update_preview)  # type: ignore
+        # Holding an arrow key fires selectionChanged per row; only load the row the user settles on
+        self._preview_timer = QTimer(self); self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(120)
+        self._preview_timer.timeout.connect(self._update_preview)
+        self.list.selectionModel().selectionChanged.connect(self._preview_timer.start)  # type: ignore
 
         self.preview=PreviewPane(); self.preview.setVisible(False)
         # Hook summarize button to summarization (fast extractive or deep LLM)
@@ -309,7 +654,7 @@ class SpotlightUI(QWidget):
         self.chat_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.chat_folder_btn.setFixedWidth(90)
         self.chat_folder_btn.setFixedHeight(36)
-        self.chat_folder_btn.clicked.connect(self._toggle_folder_dropdown_chat)
+        self.chat_folder_btn.clicked.connect(lambda: self._toggle_folder_dropdown(self.chat_folder_btn))
         self.chat_folder_btn.setVisible(False)
 
         self.chat_folder_chip = QLabel("All folders")
@@ -346,39 +691,251 @@ class SpotlightUI(QWidget):
         conversation_splitter = QSplitter(Qt.Orientation.Horizontal)
         conversation_splitter.setObjectName("conversationSplitter")
         
-        # Left side: Conversation history
-        conversation_widget = QWidget()
-        conversation_widget.setObjectName("conversationWidget")
-        conv_layout = QVBoxLayout(conversation_widget)
-        conv_layout.setContentsMargins(0, 0, 0, 0)  # Align with search bar
-        conv_layout.setSpacing(0)
+        # Left side: Conversation history
+        conversation_widget = QWidget()
+        conversation_widget.setObjectName("conversationWidget")
+        conv_layout = QVBoxLayout(conversation_widget)
+        conv_layout.setContentsMargins(0, 0, 0, 0)  # Align with search bar
+        conv_layout.setSpacing(0)
+        
+        # Conversation view with scrollable chat history
+        self.chat_view = ChatBrowser()
+        self.chat_view.setObjectName("conversationView")
+        # Bound layout/serialization cost as the conversation grows (also turns off undo history)
+        self.chat_view.document().setMaximumBlockCount(CHAT_MAX_BLOCKS)
+        self.chat_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        
+        conv_layout.addWidget(self.chat_view, 1)
+        
+        # Right side: Preview pane (integrated)
+        self.conversation_preview = PreviewPane()
+        self.conversation_preview.setObjectName("conversationPreview")
+        self.conversation_preview.setVisible(False)
+        # Hook conversation preview summarize button to summarization
+        self.conversation_preview.btn_summarize.clicked.connect(self._summarize_selected)
+        
+        # Add widgets to splitter
+        conversation_splitter.addWidget(conversation_widget)
+        conversation_splitter.addWidget(self.conversation_preview)
+        conversation_splitter.setStretchFactor(0, 2)
+        conversation_splitter.setStretchFactor(1, 1)
+        conversation_splitter.setSizes([400, 300])
+        
+        cp_lay.addWidget(conversation_splitter, 1)
+        # Global loading overlay for chat page
+        self.chat_overlay = LoadingOverlay(self.chat_page)
+
+        # Stacked layout for pages
+        self.stack = QStackedLayout()
+        self.stack.addWidget(search_page)
+        self.stack.addWidget(self.chat_page)
+        outer=QVBoxLayout(self)
+        outer.setContentsMargins(0, 0, 0, 0)  
+        outer.setSpacing(0)
+        outer.addWidget(wrapper)
+        wrapper.setLayout(self.stack)
+        self._widgets_built = True
+        self._bind_texts(
+            # Chat page: force friendly placeholder regardless of previous state
+            ("ask_follow_up", (self.chat_input.setPlaceholderText,)),
+            ("settings", (self.settings_btn.setToolTip,)),
+        )
+        # Widgets retranslate themselves when the language changes
+        self.languageChanged.connect(self._rebuild_ai_mode_texts)
+        self.languageChanged.connect(self._retranslate_static_texts)
+        self.languageChanged.connect(self._update_ui_texts)
+        self._rebuild_ai_mode_texts()
+
+        # Initialize search folders based on default scope
+        self._update_search_folders()
+        
+        # Set initial AI mode (after stack is created)
+        self._set_ai_mode("No AI")
+        
+        self._apply_style(); center_on_screen(self)
+        self.resize(700, 160)  # Start in collapsed state (with proper height)
+        self.show(); self.search.setFocus()
+        
+        # Dropdown is now a popup window - no parent relationship needed
+        # Warm up local AI model in the background to avoid first-call delay
+        # (queued on the thread pool, so there is nothing to defer on the GUI thread)
+        self._warmup_ai()
+        self.btn_back.clicked.connect(self._go_back_from_conversation)
+        
+        # Initialize translations and update UI texts (after all UI elements are created)
+        self.setWindowTitle(tr("app_title"))
+        self._update_ui_texts()
+
+    def _load_logo_icon(self):
+        """Create the settings logo icon once and share it across windows."""
+        if SpotlightUI._logo_icon is None:
+            if os.path.exists(LOGO_PATH):
+                SpotlightUI._logo_icon = QIcon(LOGO_PATH)
+            else:
+                SpotlightUI._logo_icon = QIcon()
+        self._apply_logo_icon()
+
+    def _apply_logo_icon(self):
+        icon = SpotlightUI._logo_icon
+        if icon is not None and not icon.isNull():
+            self.settings_btn.setIcon(icon)
+            # Set icon size to 24x24 pixels
+            self.settings_btn.setIconSize(QSize(24, 24))
+        else:
+            # Fallback to gear icon if logo not found
+            self.settings_btn.setText("⚙")
+
+    def _on_text_changed(self, text: str):
+        # Handle UI visibility based on search input
+        has_input = bool(text.strip())
+        
+        # If there's input, show normal search interface
+        if has_input:
+            # Hide no results widget if it's showing
+            if self.no_results_widget is not None:
+                self.no_results_widget.setVisible(False)
+            
+            # Expand to show files and preview - keep same width, only change height.
+            # Geometry only changes when the expanded/collapsed state flips, not per keystroke.
+            if self._is_expanded is not True:
+                self.setUpdatesEnabled(False)
+                try:
+                    self.search_divider.setVisible(True)
+                    self.split.setVisible(True)
+                    current_width = self.width()
+                    self.resize(current_width, 640)
+                    self.setMinimumSize(current_width, 500)
+                    self.setMaximumSize(700, 800)  # Restore maximum size when expanded
+                finally:
+                    self.setUpdatesEnabled(True)
+                self._is_expanded = True
+        else:
+            # When search bar is cleared, always collapse to initial size
+            # Hide no results widget if it exists
+            if self.no_results_widget is not None:
+                self.no_results_widget.setVisible(False)
+            
+            # Collapse to show only search bar - ensure exact starting size
+            if self._is_expanded is not False:
+                self.setUpdatesEnabled(False)
+                try:
+                    self.resize(700, 160)
+                    self.setMinimumSize(700, 160)
+                    self.setMaximumSize(700, 160)  # Lock size when collapsed
+                finally:
+                    self.setUpdatesEnabled(True)
+                self._is_expanded = False
+            # Clear any existing results when search is empty
+            self.model.set_items([])
+            self.preview.hide()
+            # Stop any running workers and spinner
+            self.spinner.stop()
+            self._retire_worker(self._worker); self._worker = None
+            self._retire_worker(self._ai_worker); self._ai_worker = None
+            self._search_gen += 1; self._ai_gen += 1
+            self._last_hit_key = None
+        
+        # Only auto-search for "no AI" mode - AI modes require Enter key.
+        # Short prefixes match far more files, so wait longer before walking the filesystem;
+        # start() restarts a pending timer, coalescing bursts of keystrokes into one search.
+        n = len(text.strip())
+        if self.ai_mode == "none" and n >= MIN_AUTO_SEARCH_CHARS:
+            self._search_timer.setInterval(400 if n <= 2 else 200 if n <= 4 else 100)
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            if has_input and self.ai_mode == "none":
+                # A search for the longer, now stale query may still be running; drop its results
+                self._retire_worker(self._worker); self._worker = None
+                self._search_gen += 1
+                self.spinner.stop()
+                self.model.set_items([])
+    
+    def _retire_worker(self, worker) -> None:
+        """Ask a running worker to stop without blocking the GUI thread on wait()."""
+        if worker is None or not worker.isRunning():
+            return
+        worker.requestInterruption()
+        self._retired_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._retired_workers.discard(w))
+
+    def _update_search_folders(self):
+        """Update search folders to use default user directories."""
+        # Always search only user directories
+        self._folders = DEFAULT_FOLDERS[:]
+
+    def _build_ai_dropdown(self):
+        """Create the AI mode popup on first use."""
+        # Create dropdown menu for AI modes as a popup window
+        self.ai_dropdown = QWidget()
+        self.ai_dropdown.setObjectName("aiDropdown")
+        self.ai_dropdown.setVisible(False)
+        # Hide straight through the widget's own slot: no Python lambda on each timeout
+        self._dropdown_hide_timer.timeout.connect(self.ai_dropdown.hide)
+        self.ai_dropdown.setFixedSize(160, 120)  # Larger size for better visibility
+        self.ai_dropdown.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint | 
+            Qt.WindowType.Popup | 
+            Qt.WindowType.WindowStaysOnTopHint
+        )
+        # Enable popup behavior - can extend outside parent widget
+        
+        dropdown_layout = QVBoxLayout(self.ai_dropdown)
+        dropdown_layout.setContentsMargins(8, 8, 8, 8)
+        dropdown_layout.setSpacing(0)
         
-        # Conversation view with scrollable chat history
-        self.chat_view = ChatBrowser()
-        self.chat_view.setObjectName("conversationView")
-        self.chat_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # Create AI mode buttons
+        self.no_ai_btn = QPushButton("No AI")
+        self.no_ai_btn.setObjectName("dropdownOption")
+        self.no_ai_btn.clicked.connect(lambda: self._set_ai_mode("No AI"))
         
-        conv_layout.addWidget(self.chat_view, 1)
+        self.private_mode_btn = QPushButton("Private Mode")
+        self.private_mode_btn.setObjectName("dropdownOption")
+        self.private_mode_btn.clicked.connect(lambda: self._set_ai_mode("Private Mode"))
         
-        # Right side: Preview pane (integrated)
-        self.conversation_preview = PreviewPane()
-        self.conversation_preview.setObjectName("conversationPreview")
-        self.conversation_preview.setVisible(False)
-        # Hook conversation preview summarize button to summarization
-        self.conversation_preview.btn_summarize.clicked.connect(self._summarize_selected)
+        self.cloud_mode_btn = QPushButton("Cloud Mode")
+        self.cloud_mode_btn.setObjectName("dropdownOption")
+        self.cloud_mode_btn.clicked.connect(lambda: self._set_ai_mode("Cloud Mode"))
         
-        # Add widgets to splitter
-        conversation_splitter.addWidget(conversation_widget)
-        conversation_splitter.addWidget(self.conversation_preview)
-        conversation_splitter.setStretchFactor(0, 2)
-        conversation_splitter.setStretchFactor(1, 1)
-        conversation_splitter.setSizes([400, 300])
+        dropdown_layout.addWidget(self.no_ai_btn)
+        dropdown_layout.addWidget(self.private_mode_btn)
+        dropdown_layout.addWidget(self.cloud_mode_btn)
         
-        cp_lay.addWidget(conversation_splitter, 1)
-        # Global loading overlay for chat page
-        self.chat_overlay = LoadingOverlay(self.chat_page)
+        # Add hover events to the dropdown itself to keep it open when hovering over it
+        self.ai_dropdown.enterEvent = self._on_dropdown_hover
+        self.ai_dropdown.leaveEvent = self._on_dropdown_leave
+        self._bind_texts(
+            ("no_ai", (self.no_ai_btn.setText,)),
+            ("private_mode", (self.private_mode_btn.setText,)),
+            ("cloud_mode", (self.cloud_mode_btn.setText,)),
+        )
+
+    def _build_folder_dropdown(self):
+        """Create the RAG folder popup on first use; shared by the search and chat headers."""
+        # Quick folder dropdown (lists known folders; allows open dialog)
+        self.folder_dropdown = QWidget()
+        self.folder_dropdown.setObjectName("aiDropdown")
+        self.folder_dropdown.setVisible(False)
+        self.folder_dropdown.setFixedSize(320, 240)
+        self.folder_dropdown.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint | 
+            Qt.WindowType.Popup | 
+            Qt.WindowType.WindowStaysOnTopHint
+        )
+        fd_lay = QVBoxLayout(self.folder_dropdown); fd_lay.setContentsMargins(8,8,8,8); fd_lay.setSpacing(6)
+        self.lbl_folder_hint = QLabel("Choose folders for RAG. Recently used and defaults shown:"); self.lbl_folder_hint.setStyleSheet("color:#e5e7eb; font-size:12px;")
+        fd_lay.addWidget(self.lbl_folder_hint)
+        self.folder_list = QListWidget(); self.folder_list.setSelectionMode(self.folder_list.SelectionMode.ExtendedSelection)
+        fd_lay.addWidget(self.folder_list)
+        row = QHBoxLayout(); self.btn_add_folder = QPushButton("Add…"); self.btn_use_selected = QPushButton("Use"); self.btn_use_all = QPushButton("Use all"); row.addWidget(self.btn_add_folder); row.addStretch(1); row.addWidget(self.btn_use_all); row.addWidget(self.btn_use_selected)
+        fd_lay.addLayout(row)
+        self.btn_add_folder.clicked.connect(self._add_folder_to_list)
+        self.btn_use_selected.clicked.connect(self._apply_selected_folders)
+        self.btn_use_all.clicked.connect(self._apply_all_folders)
 
+    def _build_settings_page(self):
+        """Create the settings page on first use and insert it at stack index 2."""
         # Settings page (index 2)
         self.settings_page = QWidget()
         settings_layout = QVBoxLayout(self.settings_page)
@@ -453,102 +1010,18 @@ class SpotlightUI(QWidget):
         
         settings_layout.addWidget(future_section)
         settings_layout.addStretch(1)  # Push content to top
-
-        # Stacked layout for pages
-        self.stack = QStackedLayout()
-        self.stack.addWidget(search_page)
-        self.stack.addWidget(self.chat_page)
-        self.stack.addWidget(self.settings_page)
-        outer=QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)  
-        outer.setSpacing(0)
-        outer.addWidget(wrapper)
-        wrapper.setLayout(self.stack)
-
-        # Initialize search folders based on default scope
-        self._update_search_folders()
-        
-        # Set initial AI mode (after stack is created)
-        self._set_ai_mode("No AI")
-        
-        self._apply_style(); center_on_screen(self)
-        self.resize(700, 160)  # Start in collapsed state (with proper height)
-        self.show(); self.search.setFocus()
-        
-        # Dropdown is now a popup window - no parent relationship needed
-        # Warm up local AI model in the background to avoid first-call delay
-        try:
-            QTimer.singleShot(50, self._warmup_ai)
-        except Exception:
-            pass
-        self.btn_back.clicked.connect(self._go_back_from_conversation)
+        self.stack.insertWidget(2, self.settings_page)
         self.btn_settings_back.clicked.connect(self._hide_settings)
-        self.language_combo.currentTextChanged.connect(self._on_language_changed)
-        
-        # Initialize translations and update UI texts (after all UI elements are created)
-        self._update_ui_texts()
-
-    def _on_text_changed(self, text: str):
-        # Handle UI visibility based on search input
-        has_input = bool(text.strip())
-        
-        # If there's input, show normal search interface
-        if has_input:
-            # Hide no results widget if it's showing
-            if hasattr(self, 'no_results_widget'):
-                self.no_results_widget.setVisible(False)
-            
-            # Show/hide the main content area (files list and preview)
-            self.search_divider.setVisible(True)
-            self.split.setVisible(True)
-            
-            # Expand to show files and preview - keep same width, only change height
-            current_width = self.width()
-            self.resize(current_width, 640)
-            self.setMinimumSize(current_width, 500)
-            self.setMaximumSize(700, 800)  # Restore maximum size when expanded
-            
-            # Only auto-search for "no AI" mode - AI modes require Enter key
-            if self.ai_mode == "none":
-                self._perform_search()
-        else:
-            # When search bar is cleared, always collapse to initial size
-            # Hide no results widget if it exists
-            if hasattr(self, 'no_results_widget'):
-                self.no_results_widget.setVisible(False)
-            
-            # Collapse to show only search bar - ensure exact starting size
-            self.resize(700, 160)
-            self.setMinimumSize(700, 160)
-            self.setMaximumSize(700, 160)  # Lock size when collapsed
-            # Clear any existing results when search is empty
-            self.model.set_items([])
-            self.preview.hide()
-            # Stop any running workers and spinner
-            self.spinner.stop()
-            if self._worker and self._worker.isRunning():
-                self._worker.requestInterruption()
-                self._worker.quit()
-                self._worker.wait(50)
-            if self._ai_worker and self._ai_worker.isRunning():
-                self._ai_worker.requestInterruption()
-                self._ai_worker.quit()
-                self._ai_worker.wait(50)
-        
-        # Only use timer for non-AI modes (No AI)
-        if self.ai_mode == "none":
-            self._search_timer.start()
-        else:
-            self._search_timer.stop()
-    
-    def _update_search_folders(self):
-        """Update search folders to use default user directories."""
-        # Always search only user directories
-        self._folders = DEFAULT_FOLDERS[:]
+        # `activated` only fires for user selections, not programmatic setCurrentIndex calls
+        self.language_combo.activated.connect(self._on_language_changed)
+        self._bind_texts(
+            ("settings", (self.lbl_settings_title.setText,)),
+            ("language", (self.lbl_language.setText,)),
+        )
 
     def _position_dropdown(self):
         """Position the dropdown popup relative to the AI button."""
-        if not self.ai_dropdown.isVisible():
+        if self.ai_dropdown is None or not self.ai_dropdown.isVisible():
             return
         
         # Get the AI button's global position
@@ -559,46 +1032,60 @@ class SpotlightUI(QWidget):
     
     def _toggle_ai_dropdown(self):
         """Toggle the AI dropdown menu visibility (click-only behavior)."""
+        if self.ai_dropdown is None:
+            self._build_ai_dropdown()
         is_visible = self.ai_dropdown.isVisible()
         
         if is_visible:
             # Hide dropdown
             self.ai_dropdown.setVisible(False)
             # Cancel any pending hide timer
-            if hasattr(self, '_dropdown_hide_timer'):
-                self._dropdown_hide_timer.stop()
+            self._dropdown_hide_timer.stop()
         else:
             # Show dropdown
             self.ai_dropdown.setVisible(True)
             self._position_dropdown()
             # Cancel any pending hide timer when showing
-            if hasattr(self, '_dropdown_hide_timer'):
-                self._dropdown_hide_timer.stop()
+            self._dropdown_hide_timer.stop()
 
-    def _toggle_folder_dropdown(self):
+    def _toggle_folder_dropdown(self, anchor: QWidget):
+        if self.folder_dropdown is None:
+            self._build_folder_dropdown()
         is_visible = self.folder_dropdown.isVisible()
         if is_visible:
             self.folder_dropdown.setVisible(False)
         else:
             # position under button
-            g = self.folder_btn.mapToGlobal(self.folder_btn.rect().bottomLeft())
+            g = anchor.mapToGlobal(anchor.rect().bottomLeft())
             self.folder_dropdown.move(g.x(), g.y() + 4)
             # refresh list
             self._update_ui_texts()
             self.folder_dropdown.setVisible(True)
 
     def _add_folder_to_list(self):
-        path = QFileDialog.getExistingDirectory(self, "Choose folder", os.path.expanduser("~"))
+        # Window-modal open() instead of the static getExistingDirectory(): no nested
+        # event loop, so spinners and streaming chat keep painting behind the dialog.
+        dlg = QFileDialog(self, "Choose folder", os.path.expanduser("~"))
+        dlg.setFileMode(QFileDialog.FileMode.Directory)
+        dlg.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        dlg.fileSelected.connect(self._on_folder_chosen)
+        self._folder_dlg = dlg  # keep a reference until the dialog closes
+        dlg.open()
+
+    def _on_folder_chosen(self, path: str):
         if path:
             if path not in self._rag_folders:
                 self._rag_folders.append(path)
                 self.folder_list.addItem(path)
 
     def _apply_selected_folders(self):
-        selected = [self.folder_list.item(i).text() for i in range(self.folder_list.count()) if self.folder_list.item(i).isSelected()]
+        # selectedItems() hands back the selection in one call instead of
+        # probing item(i)/isSelected() per row
+        selected = [it.text() for it in self.folder_list.selectedItems()]
         if not selected:
             selected = [self.folder_list.item(i).text() for i in range(self.folder_list.count())]
         self._rag_folders = selected
+        self._result_cache.clear()
         # Start background indexing with progress dialog
         try:
             self._start_indexing(self._rag_folders, exclude=["node_modules", "__pycache__", ".git"], replace=True)
@@ -611,132 +1098,88 @@ class SpotlightUI(QWidget):
     def _update_folder_chips(self):
         """Sync folder scope chips (search bar and chat header) with current selection."""
         try:
-            if len(self._rag_folders) == 0:
+            key = tuple(self._rag_folders)
+            # Chips already show this selection: nothing to rebuild or re-set
+            if self._chip_cache is not None and self._chip_cache[0] == key:
+                return
+            if len(key) == 0:
                 label = "All folders"; tooltip = "RAG searches all indexed folders"
-            elif len(self._rag_folders) == 1:
-                import os as _os
-                base = _os.path.basename(self._rag_folders[0]) or self._rag_folders[0]
-                label = base; tooltip = self._rag_folders[0]
+            elif len(key) == 1:
+                label = os.path.basename(key[0]) or key[0]; tooltip = key[0]
             else:
-                label = f"{len(self._rag_folders)} folders"; tooltip = "\n".join(self._rag_folders)
-            if hasattr(self, 'folder_chip'):
-                self.folder_chip.setText(label); self.folder_chip.setToolTip(tooltip)
-            if hasattr(self, 'chat_folder_chip'):
-                self.chat_folder_chip.setText(label); self.chat_folder_chip.setToolTip(tooltip)
+                label = f"{len(key)} folders"; tooltip = "\n".join(key)
+            self._chip_cache = (key, label, tooltip)
+            # Both chips are created in __init__, before any handler can get here
+            self.folder_chip.setText(label); self.folder_chip.setToolTip(tooltip)
+            self.chat_folder_chip.setText(label); self.chat_folder_chip.setToolTip(tooltip)
         except Exception:
             pass
 
     def _apply_all_folders(self):
         """Switch back to using all indexed folders (clears explicit selection)."""
         self._rag_folders = []
+        self._result_cache.clear()
         self._update_folder_chips()
         self.folder_dropdown.setVisible(False)
     
     def _on_dropdown_hover(self, event):
         """Keep dropdown open when hovering over it."""
         # Cancel any pending hide timer
-        if hasattr(self, '_dropdown_hide_timer'):
-            self._dropdown_hide_timer.stop()
+        self._dropdown_hide_timer.stop()
         # Call the parent class enterEvent properly
         QWidget.enterEvent(self.ai_dropdown, event)
     
     def _on_dropdown_leave(self, event):
         """Hide dropdown when leaving dropdown area."""
         # Use a timer to delay hiding to allow moving back to dropdown
-        self._dropdown_hide_timer = QTimer()
-        self._dropdown_hide_timer.setSingleShot(True)
-        self._dropdown_hide_timer.timeout.connect(lambda: self.ai_dropdown.setVisible(False))
-        self._dropdown_hide_timer.start(200)
+        self._dropdown_hide_timer.start()
         # Call the parent class leaveEvent properly
         QWidget.leaveEvent(self.ai_dropdown, event)
     
     def _set_ai_mode(self, mode_text: str):
         """Handle mode change between No AI, Private (local AI), and Cloud (OpenAI API) modes."""
         self._search_timer.stop()
-        self.ai_dropdown.setVisible(False)  # Hide dropdown after selection
+        self._result_cache.clear()
+        self._rerank_cache.clear()  # another backend would rank differently
+        self._last_hit_key = None
+        if self.ai_dropdown is not None:
+            self.ai_dropdown.setVisible(False)  # Hide dropdown after selection
+        # Local refs for the optional widgets used across the branches below
+        cp = self.conversation_preview
+        fb, fc = self.folder_btn, self.folder_chip
+        cfb, cfc = self.chat_folder_btn, self.chat_folder_chip
         
         # Update button text and styling based on mode
-        if mode_text == "No AI":
-            self.ai_mode = "none"
-            # Switch back to search page
-            self.stack.setCurrentIndex(0)
-            self._clear_conversation()
-            # Hide summarize button in No AI mode
-            self.preview.btn_summarize.setVisible(False)
-            # Also hide summarize button in conversation preview
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.btn_summarize.setVisible(False)
-            # Update summarize button visibility for both previews
-            self.preview.update_summarize_button_visibility(self.ai_mode)
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.update_summarize_button_visibility(self.ai_mode)
-            # Hide folder controls in No AI mode
-            if hasattr(self, 'folder_btn'):
-                self.folder_btn.setVisible(False)
-            if hasattr(self, 'folder_chip'):
-                self.folder_chip.setVisible(False)
-        elif mode_text == "Private Mode":
-            self.ai_mode = "private"
-            # Reinitialize AI with private mode
-            self.ai = LumaAI(mode=self.ai_mode, openai_api_key=self.openai_api_key)
-            # Clear conversation and switch to conversation page
-            self._clear_conversation()
-            self._switch_to_conversation_mode()
-            # Show summarize button in Private mode
-            self.preview.btn_summarize.setVisible(True)
-            # Also show summarize button in conversation preview
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.btn_summarize.setVisible(True)
-            # Update summarize button visibility for both previews
-            self.preview.update_summarize_button_visibility(self.ai_mode)
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.update_summarize_button_visibility(self.ai_mode)
-            # Show folder controls in AI modes
-            if hasattr(self, 'folder_btn'):
-                self.folder_btn.setVisible(True)
-            if hasattr(self, 'folder_chip'):
-                self.folder_chip.setVisible(True)
-            # Show folder controls in AI modes
-            if hasattr(self, 'chat_folder_btn'):
-                self.chat_folder_btn.setVisible(True)
-            if hasattr(self, 'chat_folder_chip'):
-                self.chat_folder_chip.setVisible(True)
-            # Warm up the AI mode
-            try:
-                QTimer.singleShot(50, self._warmup_ai)
-            except Exception:
-                pass
-        elif mode_text == "Cloud Mode":
-            self.ai_mode = "cloud"
-            # Reinitialize AI with cloud mode
+        config = _MODE_CONFIG.get(mode_text)
+        if config is None:
+            return
+        prev_mode = self.ai_mode
+        self.ai_mode, conversational = config
+        if conversational:
+            # Reinitialize AI for the chosen backend, then open a fresh conversation page
             self.ai = LumaAI(mode=self.ai_mode, openai_api_key=self.openai_api_key)
-            # Clear conversation and switch to conversation page
             self._clear_conversation()
             self._switch_to_conversation_mode()
-            # Show summarize button in Cloud mode
-            self.preview.btn_summarize.setVisible(True)
-            # Also show summarize button in conversation preview
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.btn_summarize.setVisible(True)
-            # Update summarize button visibility for both previews
-            self.preview.update_summarize_button_visibility(self.ai_mode)
-            if hasattr(self, 'conversation_preview'):
-                self.conversation_preview.update_summarize_button_visibility(self.ai_mode)
-            # Show folder controls in AI modes
-            if hasattr(self, 'folder_btn'):
-                self.folder_btn.setVisible(True)
-            if hasattr(self, 'folder_chip'):
-                self.folder_chip.setVisible(True)
-            # Show folder controls in AI modes
-            if hasattr(self, 'chat_folder_btn'):
-                self.chat_folder_btn.setVisible(True)
-            if hasattr(self, 'chat_folder_chip'):
-                self.chat_folder_chip.setVisible(True)
+        else:
+            # Switch back to search page
+            self.stack.setCurrentIndex(0)
+            # The chat page is only written to in AI modes; coming from No AI there is nothing
+            # to clear, and re-parsing the placeholder HTML would be wasted work.
+            # (Any AI mode clears it again on entry.)
+            if prev_mode != "none":
+                self._clear_conversation()
+        # Summarize buttons only exist in AI modes; each preview then refines for its current file
+        for pane in (self.preview, cp):
+            if pane is not None:
+                pane.btn_summarize.setVisible(conversational)
+                pane.update_summarize_button_visibility(self.ai_mode)
+        # Folder controls are shown in AI modes; No AI only hides the search-bar pair
+        for w in ((fb, fc, cfb, cfc) if conversational else (fb, fc)):
+            if w is not None:
+                w.setVisible(conversational)
+        if conversational:
             # Warm up the AI mode
-            try:
-                QTimer.singleShot(50, self._warmup_ai)
-            except Exception:
-                pass
+            QTimer.singleShot(50, self._warmup_ai)
         
         # Reset search state when AI mode changes
         self._has_searched = False
@@ -752,8 +1195,7 @@ class SpotlightUI(QWidget):
         target_folders = folders if folders else self._folders
         if folders and kws:
             # Remove folder-like tokens to avoid filtering away files by ext match
-            import re
-            kws = [w for w in kws if not re.fullmatch(r"folder|folders|dir|directory", w, re.IGNORECASE)]
+            kws = [w for w in kws if w.lower() not in _FOLDER_TOKENS]
         allow_exts = FILETYPE_MAP.get(category, [])[:]
         ai_exts = info.get("file_types", [])
         
@@ -777,8 +1219,9 @@ class SpotlightUI(QWidget):
         # Remember keywords for conditional rerank logic
         self._last_keywords = kws[:]
         
-        if self._worker and self._worker.isRunning():
-            self._worker.requestInterruption(); self._worker.quit(); self._worker.wait(50)
+        self._retire_worker(self._worker); self._worker = None
+        self._search_gen += 1
+        gen = self._search_gen
         self.preview.hide(); self.spinner.start()
         # Store metadata for reranker guardrails
         self._last_time_range = tr
@@ -786,12 +1229,34 @@ class SpotlightUI(QWidget):
         self._last_folders = target_folders
         self._last_folder_depth = info.get("folder_depth", "any")
         
+        q = self.search.text().strip()
+        # Retyped/backspaced queries resolve to the same search parameters; serve them from memory
+        cache_key = (tuple(target_folders), tuple(kws), tuple(allow_exts), tr, tattr, tuple(semantic_keywords), tuple(file_patterns))
+        cached = self._result_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < RESULT_CACHE_TTL:
+            self._result_cache.move_to_end(cache_key)
+            self._dispatch_search_results(q, cached[1])
+            return
+
         self._worker=SearchWorker(target_folders, kws, allow_exts, tr, tattr, semantic_keywords, file_patterns)
+        self._worker.results_ready.connect(lambda hits, q=q, key=cache_key, gen=gen: self._on_search_results(gen, key, q, hits))
+        self._worker.start()
+
+    def _on_search_results(self, gen: int, cache_key: tuple, query: str, hits: List[FileHit]):
+        self._result_cache[cache_key] = (time.monotonic(), hits)
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        # A newer search (or a cleared query) superseded this one; keep the cache entry only
+        if gen != self._search_gen:
+            return
+        self._dispatch_search_results(query, hits)
+
+    def _dispatch_search_results(self, query: str, hits: List[FileHit]):
         if self.ai_mode != "none":
-            self._worker.results_ready.connect(lambda hits, q=self.search.text().strip(): self._maybe_rerank(q, hits))
+            self._maybe_rerank(query, hits)
         else:
-            self._worker.results_ready.connect(lambda hits: self._apply_hits(self._conditioned_rerank(hits)))
-        self._worker.start()
+            self._apply_hits(self._conditioned_rerank(hits))
 
     def _perform_search(self):
         q=self.search.text().strip()
@@ -803,8 +1268,7 @@ class SpotlightUI(QWidget):
         if self.ai_mode == "none":
             # No AI: never use RAG; always local filename listing with strict ext when user says ppt/powerpoint
             info = self.ai.parse_query_nonai(q)
-            import re as _re
-            if _re.search(r"\b(pptx?|power\s*point|powerpoint)\b", q, _re.IGNORECASE):
+            if _RE_PPT.search(q):
                 allow_exts = ['.ppt', '.pptx']
                 info['file_types'] = allow_exts
             self._start_search_with_info(info, "User")
@@ -814,78 +1278,56 @@ class SpotlightUI(QWidget):
             # In AI modes: if cross-doc, run RAG; else do AI-assisted listing
             route = self.ai.route_query(q)
             if route == "rag":
+                self.chat_view.clear()
+                self.chat_view.append("<div style='margin:6px 0 12px 0; color:#6b7280;'>Asking across your documents…</div>")
+                # Show loading indicator (overlay + small spinner) while RAG runs
+                self.chat_spinner.start()
+                self._show_loading(_THINKING_TEXT)
+                self._append_thinking_line()
+                # Only the model/index call can fail here; everything else is plain widget work
                 try:
-                    self.chat_view.clear()
-                    self.chat_view.append("<div style='margin:6px 0 12px 0; color:#6b7280;'>Asking across your documents…</div>")
-                    # Show loading indicator (overlay + small spinner) while RAG runs
-                    try:
-                        self.chat_spinner.start()
-                        self._show_loading("AI is thinking…")
-                        self.chat_view.append("AI is thinking…\n")
-                    except Exception:
-                        pass
                     res = self.ai.crossdoc_answer(q, n_ctx=12)
+                except Exception:
+                    res = None
+                # Stop spinner and clear the thinking line
+                self.chat_spinner.stop()
+                self._clear_thinking_line()
+                if res is not None:
                     ans = (res.get("answer") or "").replace("\n","<br>")
                     hits = res.get("hits", [])
                     low = bool(res.get("low_confidence", False))
-                    # Stop spinner and clear the thinking line
-                    try:
-                        self.chat_spinner.stop()
-                        self._clear_thinking_line()
-                    except Exception:
-                        pass
                     self._add_ai_message(ans)
-                    for i, (score, meta) in enumerate(hits, start=1):
-                        path = str(meta.get("path", ""))
-                        page = meta.get("page")
-                        tag = f"{path}:p{page}" if page else path
-                        snippet = str(meta.get("text", ""))[:320].replace("\n", " ")
-                        card_html = (
-                            f"<div style='border:1px solid #e5e7eb; border-radius:10px; padding:10px; margin:8px 20% 8px 0;'>"
-                            f"<div style='font-weight:600; margin-bottom:6px;'>[{i}] {tag}</div>"
-                            f"<div style='color:#374151; font-size:0.95em;'>{snippet}</div>"
-                            f"</div>"
-                        )
-                        self.chat_view.append(card_html)
-                    # Append structured Sources block
-                    if hits:
-                        sources_html = "<div style='margin:8px 0 4px 0; color:#6b7280; font-weight:600;'>Sources</div>"
-                        self.chat_view.append(sources_html)
-                        for i, (score, meta) in enumerate(hits, start=1):
-                            path = str(meta.get("path", ""))
-                            page = meta.get("page")
-                            tag = f"{path}:p{page}" if page else path
-                            from urllib.parse import quote
-                            qp = quote(path)
-                            snippet = str(meta.get("text", ""))[:220].replace("\n", " ")
-                            block = (
-                                f"<div style='border:1px solid #e5e7eb; border-radius:10px; padding:10px; margin:6px 20% 6px 0;'>"
-                                f"<div style='display:flex; justify-content:space-between; align-items:center; margin-bottom:6px;'>"
-                                f"<div style='font-weight:600;'>[{i}] {tag}</div>"
-                                f"<div>"
-                                f"<a href='luma://select?path={qp}' style='margin-right:8px;'>Preview</a>"
-                                f"<a href='luma://select?path={qp}' onclick='return false;' style='margin-right:0;'>Open</a>"
-                                f"</div>"
-                                f"</div>"
-                                f"<div style='color:#374151; font-size:0.95em;'>{snippet}</div>"
-                                f"</div>"
-                            )
-                            self.chat_view.append(block)
-                    if low:
-                        self.chat_view.append(
-                            "<div style='background:#fef3c7; color:#92400e; padding:10px; border-radius:10px; border-left:4px solid #f59e0b; margin:8px 20% 0 0;'>Not enough info in your files</div>"
-                        )
+                    self._append_rag_hits(hits, low, with_sources=True)
                     return
-                except Exception:
-                    # If RAG fails, fallback to AI listing flow
-                    try:
-                        self.chat_spinner.stop()
-                        self._clear_thinking_line()
-                    except Exception:
-                        pass
-                    pass
+                # If RAG fails, fallback to AI listing flow
             self._handle_ai_query(q)
 
+    def _append_rag_hits(self, hits, low: bool, with_sources: bool = False):
+        """Render RAG citation cards (and optionally the Sources list) in one append."""
+        parts = []
+        tags = []
+        nl = _NL_TO_SPACE
+        for i, (score, meta) in enumerate(hits, start=1):
+            get = meta.get
+            # Index metadata is JSON, so these are already strings (or missing)
+            path = get("path") or ""
+            page = get("page")
+            tag = f"{path}:p{page}" if page else path
+            text = get("text") or ""
+            tags.append((i, path, tag, text))
+            parts.append(_RAG_CARD_HTML % (i, tag, text[:320].translate(nl)))
+        # Append structured Sources block
+        if with_sources and tags:
+            parts.append(_RAG_SOURCES_HEADER_HTML)
+            for i, path, tag, text in tags:
+                qp = quote(path)
+                parts.append(_RAG_SOURCE_HTML % (i, tag, qp, qp, text[:220].translate(nl)))
+        if low:
+            parts.append(_RAG_LOW_CONFIDENCE_HTML)
+        if parts:
+            # One parse/layout pass for the whole batch instead of one per card
+            self.chat_view.append("".join(parts))
+
     def _switch_to_conversation_mode(self):
         """Switch to conversation mode and update UI accordingly."""
         self.stack.setCurrentIndex(1)
@@ -893,38 +1335,52 @@ class SpotlightUI(QWidget):
         # Show placeholder text
         self._show_ask_anything_placeholder()
         # Resize window for conversation mode
-        self.resize(900, 600)
-        self.setMinimumSize(900, 600)
-        self.setMaximumSize(1200, 800)
+        self._set_window_geometry(900, 600, (900, 600), (1200, 800))
+        self._is_expanded = None
+
+    def _set_window_geometry(self, width: int, height: int, min_size: tuple, max_size: tuple):
+        """Apply size limits and size in one repaint, skipping setters whose value is already current.
+
+        Limits go first so the resize is not clamped by the previous state's bounds.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            if (self.minimumWidth(), self.minimumHeight()) != min_size:
+                self.setMinimumSize(*min_size)
+            if (self.maximumWidth(), self.maximumHeight()) != max_size:
+                self.setMaximumSize(*max_size)
+            if (self.width(), self.height()) != (width, height):
+                self.resize(width, height)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
         
     def _update_conversation_mode_indicator(self):
         """Update the mode indicator in conversation header."""
-        if self.ai_mode == "private":
-            self.mode_display.setText("🔒 Private Mode")
-            self.mode_display.setStyleSheet("color: #10b981; font-weight: 500;")
-        elif self.ai_mode == "cloud":
-            self.mode_display.setText("☁️ Cloud Mode")
-            self.mode_display.setStyleSheet("color: #3b82f6; font-weight: 500;")
-        else:
-            self.mode_display.setText("No AI")
-            self.mode_display.setStyleSheet("color: #6b7280; font-weight: 500;")
+        text, qss = _MODE_INDICATOR.get(self.ai_mode, _MODE_INDICATOR["none"])
+        self.mode_display.setText(text)
+        # setStyleSheet re-parses and re-polishes even for the same sheet; this runs on
+        # every mode switch and again from a delayed timer, so skip the no-op case
+        if self.mode_display.styleSheet() != qss:
+            self.mode_display.setStyleSheet(qss)
     
     def _clear_conversation(self):
         """Clear the conversation history."""
-        self.chat_view.clear()
+        # (setHtml in the placeholder replaces the whole document; no separate clear() pass)
         self.conversation_preview.hide()
         self._current_chat_file = None
+        self._pending_expands.clear()
         self._show_ask_anything_placeholder()
     
     def _show_ask_anything_placeholder(self):
         """Show the 'Ask Anything' placeholder text in the conversation view."""
-        self.chat_view.setHtml("""
-        <div style="display: flex; align-items: center; justify-content: center; height: 100%; min-height: 300px;">
-            <div style="text-align: center;">
-                <div style="font-size: 24px; font-weight: 600; color: #1e293b; margin-bottom: 8px;">Ask Anything</div>
-            </div>
-        </div>
-        """)
+        doc = self.chat_view.document()
+        # Still showing it, untouched since (e.g. switching between AI modes): skip the reparse
+        # and full relayout; any edit bumps the document revision
+        if doc.revision() == self._placeholder_revision:
+            return
+        self.chat_view.setHtml(_ASK_PLACEHOLDER_HTML)
+        self._placeholder_revision = doc.revision()
         
     def _handle_ai_query(self, query: str):
         """Handle AI query in conversation mode."""
@@ -936,8 +1392,8 @@ class SpotlightUI(QWidget):
         
         # Show loading indicator (overlay + small spinner)
         self.chat_spinner.start()
-        self._show_loading("AI is thinking…")
-        self.chat_view.append("AI is thinking…\n")
+        self._show_loading(_THINKING_TEXT)
+        self._append_thinking_line()
         
         # Route: cross-document questions use RAG; otherwise use AI understanding + listing
         try:
@@ -945,29 +1401,30 @@ class SpotlightUI(QWidget):
         except Exception:
             route = "list"
         # Reset RAG context if user explicitly asks for files/folders → switch to listing
-        import re
-        if re.search(r"\b(show|list|open)\b.*\b(folder|directory|under|in)\b", query, re.IGNORECASE):
+        if _RE_LIST_INTENT.search(query):
             route = "list"
         # Force RAG summary when the user asks for a summary/what/which without file-browse intent
-        if route != "rag" and re.search(r"\b(summary|summar(ize|ise)|what\b|which\b)", query, re.IGNORECASE):
+        if route != "rag" and _RE_RAG_INTENT.search(query):
             route = "rag"
         if route == "rag":
+            # If index seems empty, show onboarding banner with 1-click init
+            try:
+                probe = rag_search("__probe__", k=1)
+            except Exception:
+                probe = []
+            if not probe:
+                banner = (
+                    "<div style='background:#eef2ff; color:#3730a3; padding:12px; border-radius:12px; border-left:4px solid #6366f1; margin:8px 20% 12px 0;'>"
+                    "Build your private index to answer from your files. "
+                    "<a href='luma://rag?action=init'>Index now</a>"
+                    "</div>"
+                )
+                self.chat_view.append(banner)
             try:
-                # If index seems empty, show onboarding banner with 1-click init
-                try:
-                    from luma_mod.rag.query import search as rag_search
-                    probe = rag_search("__probe__", k=1)
-                except Exception:
-                    probe = []
-                if not probe:
-                    banner = (
-                        "<div style='background:#eef2ff; color:#3730a3; padding:12px; border-radius:12px; border-left:4px solid #6366f1; margin:8px 20% 12px 0;'>"
-                        "Build your private index to answer from your files. "
-                        "<a href='luma://rag?action=init'>Index now</a>"
-                        "</div>"
-                    )
-                    self.chat_view.append(banner)
                 res = self.ai.crossdoc_answer(query, n_ctx=12)
+            except Exception:
+                res = None  # Fall through to AI understanding flow on failure
+            if res is not None:
                 ans = (res.get("answer") or "").replace("\n","<br>")
                 hits = res.get("hits", [])
                 low = bool(res.get("low_confidence", False))
@@ -976,47 +1433,78 @@ class SpotlightUI(QWidget):
                 self._clear_thinking_line()
                 # Show answer with citations
                 self._add_ai_message(ans)
-                for i, (score, meta) in enumerate(hits, start=1):
-                    path = str(meta.get("path", ""))
-                    page = meta.get("page")
-                    tag = f"{path}:p{page}" if page else path
-                    snippet = str(meta.get("text", ""))[:320].replace("\n", " ")
-                    card_html = (
-                        f"<div style='border:1px solid #e5e7eb; border-radius:10px; padding:10px; margin:8px 20% 8px 0;'>"
-                        f"<div style='font-weight:600; margin-bottom:6px;'>[{i}] {tag}</div>"
-                        f"<div style='color:#374151; font-size:0.95em;'>{snippet}</div>"
-                        f"</div>"
-                    )
-                    self.chat_view.append(card_html)
-                if low:
-                    self.chat_view.append(
-                        "<div style='background:#fef3c7; color:#92400e; padding:10px; border-radius:10px; border-left:4px solid #f59e0b; margin:8px 20% 0 0;'>Not enough info in your files</div>"
-                    )
+                self._append_rag_hits(hits, low)
                 return
-            except Exception:
-                # Fall through to AI understanding flow on failure
-                pass
 
         # Process via AI understanding (listing path)
-        if self._ai_worker and self._ai_worker.isRunning():
-            try:
-                self._ai_worker.requestInterruption()
-                self._ai_worker.quit()
-                self._ai_worker.wait(50)
-            except Exception:
-                pass
+        self._retire_worker(self._ai_worker)
+        self._ai_gen += 1
         self._ai_worker = AIWorker(self.ai, query, True)
-        self._ai_worker.info_ready.connect(self._handle_ai_response)
+        self._ai_worker.info_ready.connect(lambda info, gen=self._ai_gen: self._on_ai_info(gen, info))
         self._ai_worker.start()
 
+    def _on_ai_info(self, gen: int, info: dict):
+        # Drop parses for queries that were cancelled or superseded
+        if gen == self._ai_gen:
+            self._handle_ai_response(info)
+
+    def _append_thinking_line(self):
+        """Append the transient thinking line, remembering exactly which range it occupies."""
+        doc = self.chat_view.document()
+        self.chat_view.append(_THINKING_LINE)
+        # Measured from the end: the block cap may have trimmed the front during the append.
+        # The line is the block before the trailing empty one, plus the separator ahead of it.
+        start = doc.lastBlock().previous().position() - 1
+        self._thinking_range = (start, doc.characterCount() - 1)
+
+    def _remove_thinking_line(self):
+        """Delete the range recorded by _append_thinking_line (no scan of the transcript).
+
+        The range is only trusted if it still holds the thinking text; the document may have
+        been cleared or replaced since, or CHAT_MAX_BLOCKS may have trimmed older turns and
+        shifted it, in which case the line is looked up once from the end.
+        """
+        rng, self._thinking_range = self._thinking_range, None
+        if rng is None:
+            return
+        start, end = rng
+        doc = self.chat_view.document()
+        if self._remove_range_if_thinking(start, end):
+            return
+        found = doc.find(_THINKING_TEXT, doc.characterCount() - 1, _FIND_BACKWARD)
+        if not found.isNull():
+            shift = found.selectionStart() - 1 - start
+            self._remove_range_if_thinking(start + shift, end + shift)
+
+    def _remove_range_if_thinking(self, start: int, end: int) -> bool:
+        doc = self.chat_view.document()
+        if start < 0 or end > doc.characterCount() - 1:
+            return False
+        cursor = QTextCursor(doc)
+        cursor.setPosition(start)
+        cursor.setPosition(end, _KEEP_ANCHOR)
+        if cursor.selectedText().strip("\u2029") != _THINKING_TEXT:
+            return False
+        cursor.removeSelectedText()
+        return True
+
+    def _replace_chat_text(self, needle: str, html: str):
+        """Swap the latest occurrence of needle in the transcript for html, in place.
+
+        Avoids a toHtml()/setHtml() round-trip, which reserialized and relaid out the whole chat.
+        """
+        doc = self.chat_view.document()
+        cursor = doc.find(needle, doc.characterCount() - 1, _FIND_BACKWARD)
+        if not cursor.isNull():
+            # insertHtml drops the bubble's text colour; carry it over onto the new text
+            fmt, start = cursor.charFormat(), cursor.selectionStart()
+            cursor.insertHtml(html)
+            cursor.setPosition(start, _KEEP_ANCHOR)
+            cursor.mergeCharFormat(fmt)
+
     def _clear_thinking_line(self):
         try:
-            cursor = self.chat_view.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            cursor.select(cursor.SelectionType.BlockUnderCursor)
-            if "AI is thinking…" in cursor.selectedText():
-                cursor.removeSelectedText()
-                cursor.deletePreviousChar()
+            self._remove_thinking_line()
         except Exception:
             pass
         # Always hide overlay when clearing thinking line
@@ -1024,84 +1512,37 @@ class SpotlightUI(QWidget):
 
     def _show_loading(self, text: str):
         try:
-            if hasattr(self, 'chat_overlay') and self.chat_overlay:
+            if self.chat_overlay is not None:
                 self.chat_overlay.show_overlay(text)
         except Exception:
             pass
 
     def _hide_loading(self):
         try:
-            if hasattr(self, 'chat_overlay') and self.chat_overlay:
+            if self.chat_overlay is not None:
                 self.chat_overlay.hide_overlay()
         except Exception:
             pass
         
-    def _add_user_message(self, message: str):
-        """Add a grouped Q/A card container with the user's message and an AI placeholder."""
-        from datetime import datetime
-        self._turn_idx += 1
-
-        # Convert file/folder paths to clickable links
-        clickable_message = make_paths_clickable(message)
-        timestamp = datetime.now().strftime("%H:%M")
-
-        # Unique placeholder token for this turn. We'll replace it when AI responds.
-        placeholder = f"<!--AI_SLOT_{self._turn_idx}-->"
-
-        # Q/A card wrapper with rounded corners and subtle border
-        qa_card_html = f"""
-        <div id='qa-{self._turn_idx}' style='background:#ffffff; border:1px solid #e5e7eb; border-radius:16px; padding:14px 16px; margin:12px 0; box-shadow: 0 1px 4px rgba(0,0,0,0.05);'>
-            <div style='margin-bottom: 10px; display: flex; justify-content: flex-end;'>
-                <div style='background: #3b82f6; color: white; border-radius: 12px; padding: 10px 14px; max-width: 88%; box-shadow: 0 1px 3px rgba(0,0,0,0.1);'>
-                    <div style='display: flex; align-items: center; margin-bottom: 4px;'>
-                        <span style='background:#1d4ed8; color:#fff; border-radius:8px; font-size:11px; padding:2px 6px; margin-right:8px;'>#{self._turn_idx}</span>
-                        <span style='font-weight: 600;'>You</span>
-                        <span style='color: rgba(255,255,255,0.85); font-size: 12px; margin-left: 8px;'>{timestamp}</span>
-                    </div>
-                    <div style='color: #ffffff;'>{clickable_message}</div>
-                </div>
-            </div>
-            {placeholder}
-        </div>
-        """
+    def _add_user_message(self, message: str):
+        """Add a grouped Q/A card container with the user's message."""
+        self._turn_idx += 1
+
+        # Convert file/folder paths to clickable links
+        clickable_message = make_paths_clickable(message)
+        timestamp = datetime.now().strftime("%H:%M")
 
-        self.chat_view.append(qa_card_html)
+        self.chat_view.append(_USER_CARD_HTML % {"turn": self._turn_idx, "ts": timestamp, "msg": clickable_message})
         
         
     def _add_ai_message(self, message: str):
-        """Insert AI message into the current Q/A card if possible; otherwise append as a standalone bubble."""
-        from datetime import datetime
-
+        """Append an AI message bubble for the current turn."""
         clickable_message = make_paths_clickable(message)
         timestamp = datetime.now().strftime("%H:%M")
 
-        ai_bubble_html = f"""
-        <div style='display: flex; justify-content: flex-start;'>
-            <div style='background: #f8fafc; border: 1px solid #e2e8f0; border-radius: 12px; padding: 12px 16px; max-width: 88%; box-shadow: 0 1px 3px rgba(0,0,0,0.06);'>
-                <div style='display: flex; align-items: center; margin-bottom: 8px;'>
-                    <div style='width: 8px; height: 8px; background: #3b82f6; border-radius: 50%; margin-right: 8px;'></div>
-                    <span style='background:#e0e7ff; color:#1e293b; border-radius:8px; font-size:11px; padding:2px 6px; margin-right:8px;'>#{self._turn_idx}</span>
-                    <span style='font-weight: 600; color: #1e293b;'>AI</span>
-                    <span style='color: #64748b; font-size: 12px; margin-left: 8px;'>{timestamp}</span>
-                </div>
-                <div style='color: #1e293b;'>{clickable_message}</div>
-            </div>
-        </div>
-        """
-
-        # Try to place inside the latest Q/A card placeholder
-        placeholder = f"<!--AI_SLOT_{self._turn_idx}-->"
-        try:
-            current_html = self.chat_view.toHtml()
-            if placeholder in current_html:
-                updated = current_html.replace(placeholder, ai_bubble_html)
-                self.chat_view.setHtml(updated)
-                return
-        except Exception:
-            pass
-
-        # Fallback: append as standalone
-        self.chat_view.append(ai_bubble_html)
+        # QTextDocument drops HTML comments, so there is no in-card slot to fill:
+        # append directly instead of serializing the whole transcript to look for one.
+        self.chat_view.append(_AI_BUBBLE_HTML % {"turn": self._turn_idx, "ts": timestamp, "msg": clickable_message})
         
     def _show_ai_understanding(self, info: dict):
         """Show AI's understanding of user intent to the user."""
@@ -1111,19 +1552,22 @@ class SpotlightUI(QWidget):
         reasoning = info.get("reasoning", "")
         
         if user_intent and user_intent != "unknown":
-            # Show understanding in a special format
-            self.chat_view.append(f"<div style='margin-bottom: 12px;'>")
-            self.chat_view.append(f"<div style='background: #fef3c7; color: #92400e; padding: 12px; border-radius: 12px; border-left: 4px solid #f59e0b; margin-right: 20%;'>")
-            self.chat_view.append(f"<div style='font-weight: 600; margin-bottom: 8px;'>🧠 AI Understanding:</div>")
-            self.chat_view.append(f"<div style='margin-bottom: 6px;'><strong>Intent:</strong> {user_intent}</div>")
+            # Show understanding in a special format (built whole, appended once)
+            parts = [
+                "<div style='margin-bottom: 12px;'>",
+                "<div style='background: #fef3c7; color: #92400e; padding: 12px; border-radius: 12px; border-left: 4px solid #f59e0b; margin-right: 20%;'>",
+                "<div style='font-weight: 600; margin-bottom: 8px;'>🧠 AI Understanding:</div>",
+                f"<div style='margin-bottom: 6px;'><strong>Intent:</strong> {user_intent}</div>",
+            ]
             if search_strategy and search_strategy != "unknown":
-                self.chat_view.append(f"<div style='margin-bottom: 6px;'><strong>Strategy:</strong> {search_strategy}</div>")
+                parts.append(f"<div style='margin-bottom: 6px;'><strong>Strategy:</strong> {search_strategy}</div>")
             if confidence > 0:
                 confidence_color = "#10b981" if confidence >= 80 else "#f59e0b" if confidence >= 60 else "#ef4444"
-                self.chat_view.append(f"<div style='margin-bottom: 6px;'><strong>Confidence:</strong> <span style='color: {confidence_color};'>{confidence}%</span></div>")
+                parts.append(f"<div style='margin-bottom: 6px;'><strong>Confidence:</strong> <span style='color: {confidence_color};'>{confidence}%</span></div>")
             if reasoning and reasoning != "unknown":
-                self.chat_view.append(f"<div style='font-size: 0.9em; color: #6b7280;'><strong>Reasoning:</strong> {reasoning}</div>")
-            self.chat_view.append(f"</div></div>")
+                parts.append(f"<div style='font-size: 0.9em; color: #6b7280;'><strong>Reasoning:</strong> {reasoning}</div>")
+            parts.append("</div></div>")
+            self.chat_view.append("".join(parts))
         
     def _handle_ai_response(self, info: dict):
         """Handle AI response and show results in conversation."""
@@ -1131,12 +1575,7 @@ class SpotlightUI(QWidget):
         self._hide_loading()
         
         # Remove the "AI is thinking..." message
-        cursor = self.chat_view.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.select(cursor.SelectionType.BlockUnderCursor)
-        if "AI is thinking…" in cursor.selectedText():
-            cursor.removeSelectedText()
-            cursor.deletePreviousChar()
+        self._remove_thinking_line()
         
         # Show AI's understanding to the user
         self._show_ai_understanding(info)
@@ -1164,6 +1603,22 @@ class SpotlightUI(QWidget):
     def _apply_hits(self, hits: List[FileHit]):
         self.spinner.stop()
         
+        # Same hits under the same conditions as the list already on screen (a whitespace
+        # edit, a repeated search): skip the rerank, model reset, resize and preview reload.
+        # Only the No-AI list qualifies; AI modes add a new chat turn per query.
+        if hits and self.ai_mode == "none":
+            key = (
+                [(h.path, h.mtime) for h in hits],
+                getattr(self, '_last_keywords', None), getattr(self, '_last_file_types', None),
+                getattr(self, '_last_folders', None), getattr(self, '_last_time_range', None),
+                getattr(self, '_last_folder_depth', None),
+            )
+            if self._has_searched and key == self._last_hit_key and not self.split.isHidden():
+                return
+            self._last_hit_key = key
+        else:
+            self._last_hit_key = None
+
         # Mark that a search has been performed
         self._has_searched = True
         
@@ -1175,7 +1630,7 @@ class SpotlightUI(QWidget):
 
         if hits:
             # Hide no results widget if it exists
-            if hasattr(self, 'no_results_widget'):
+            if self.no_results_widget is not None:
                 self.no_results_widget.setVisible(False)
             
             if self.ai_mode in ["private", "cloud"]:
@@ -1188,11 +1643,9 @@ class SpotlightUI(QWidget):
                 self.search_divider.setVisible(True)
                 self.split.setVisible(True)
                 current_width = self.width()
-                self.resize(current_width, 640)
-                self.setMinimumSize(current_width, 500)
-                self.setMaximumSize(current_width, 800)  # Reset max size
+                self._set_window_geometry(current_width, 640, (current_width, 500), (current_width, 800))
                 
-                idx=self.model.index(0); self.list.setCurrentIndex(idx); self.list.scrollTo(idx, QListView.ScrollHint.PositionAtTop)
+                idx=self.model.index(0); self.list.setCurrentIndex(idx); self.list.scrollTo(idx, _SCROLL_TOP)
                 self.preview.show(); self._update_preview()
         else:
             if self.ai_mode in ["private", "cloud"]:
@@ -1203,9 +1656,9 @@ class SpotlightUI(QWidget):
                 self.search_divider.setVisible(False)
                 self.split.setVisible(False)
                 current_width = self.width()
-                self.resize(current_width, 300)  # Increased height for no results
-                self.setMinimumSize(current_width, 300)
-                self.setMaximumSize(current_width, 300)
+                # Increased height for no results
+                self._set_window_geometry(current_width, 300, (current_width, 300), (current_width, 300))
+                self._is_expanded = None
                 self._show_no_results_message()
 
     def _show_no_results_message(self):
@@ -1214,7 +1667,7 @@ class SpotlightUI(QWidget):
         self.preview.hide()
         
         # Create a simple no results widget if it doesn't exist
-        if not hasattr(self, 'no_results_widget'):
+        if self.no_results_widget is None:
             self.no_results_widget = QWidget()
             self.no_results_widget.setObjectName("noResultsWidget")
             self.no_results_widget.setStyleSheet("""
@@ -1308,7 +1761,6 @@ class SpotlightUI(QWidget):
     
     def _result_row_html(self, name: str, path: str, meta: str, icon: str) -> str:
         """Build HTML for a result row with custom link scheme matching main page style."""
-        from urllib.parse import quote
         encoded_path = quote(path)
         
         # Truncate path for display (like main page)
@@ -1316,106 +1768,83 @@ class SpotlightUI(QWidget):
         if len(display_path) > 42:
             display_path = display_path[:39] + "..."
         
-        return f"""
-        <div style='display: flex; align-items: center; padding: 8px 8px 8px 24px; margin: 3px 0px 3px 0px; border-radius: 12px; cursor: pointer; transition: background-color 0.2s;' 
-             onmouseover='this.style.backgroundColor="rgba(59, 130, 246, 0.08)"' 
-             onmouseout='this.style.backgroundColor="transparent"'>
-            <a href="luma://select?path={encoded_path}" style='display: flex; align-items: center; width: 100%; text-decoration: none; color: inherit;'>
-                <div style='width: 16px; height: 16px; margin-right: 12px; display: flex; align-items: center; justify-content: center; font-size: 12px;'>{icon}</div>
-                <div style='flex: 1; min-width: 0;'>
-                    <div style='font-weight: 600; color: #1e293b; font-size: 14px; margin-bottom: 2px;'>{name}</div>
-                    <div style='font-size: 12px; color: #64748b;'>{display_path}  •  {meta}</div>
-                </div>
-            </a>
-            </div>
-            """
+        return _RESULT_ROW_HTML % {
+            "href": encoded_path, "icon": glyph_img(icon), "name": name,
+            "path": display_path, "meta": meta,
+        }
         
     def _add_ai_turn_with_results(self, message: str, hits: List[FileHit]):
-        """Add an AI turn with collapsible folder-grouped results."""
-        from datetime import datetime
-        
-        # Group files by folder
-        folder_groups = {}
-        for hit in hits:
-            folder = os.path.dirname(hit.path)
-            if folder not in folder_groups:
-                folder_groups[folder] = []
-            folder_groups[folder].append(hit)
+        """Add an AI turn with the results as one flat file list."""
         
         # Create AI bubble HTML
         timestamp = datetime.now().strftime("%H:%M")
         
-        # Start AI bubble
-        ai_bubble_html = f"""
-        <div style='margin-bottom: 16px; display: flex; justify-content: flex-start;'>
-            <div style='background: #f8fafc; border: 1px solid #e2e8f0; border-radius: 12px; padding: 12px 16px; max-width: 80%; box-shadow: 0 1px 3px rgba(0,0,0,0.1);'>
-                <div style='display: flex; align-items: center; margin-bottom: 8px;'>
-                    <div style='width: 8px; height: 8px; background: #3b82f6; border-radius: 50%; margin-right: 8px;'></div>
-                    <span style='font-weight: 600; color: #1e293b;'>AI</span>
-                    <span style='color: #64748b; font-size: 12px; margin-left: 8px;'>{timestamp}</span>
-                </div>
-                <div style='color: #1e293b; margin-bottom: 12px;'>{message}</div>
-                <div style='background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08); border: 1px solid rgba(0,0,0,0.08); padding: 0px; margin-top: 8px;'>
-        """
+        # Start AI bubble; rows are collected and joined once at the end
+        parts = [_RESULTS_BUBBLE_OPEN_HTML % {"ts": timestamp, "msg": message}]
         
-        # Add all files in a clean list (like main page)
-        for hit in hits:
-            file_name = os.path.basename(hit.path)
-            file_size = self._format_file_size(hit.size)
-            file_date = self._format_file_date(hit.mtime)
-            meta = file_size
-            
-            # Determine file icon based on extension
-            ext = os.path.splitext(hit.path)[1].lower()
-            if ext in ['.pdf']:
-                icon = "📄"
-            elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']:
-                icon = "🖼️"
-            elif ext in ['.py']:
-                icon = "🐍"
-            elif ext in ['.js', '.ts', '.jsx', '.tsx']:
-                icon = "⚛️"
-            elif ext in ['.html', '.css']:
-                icon = "🌐"
-            elif ext in ['.doc', '.docx']:
-                icon = "📝"
-            elif ext in ['.xls', '.xlsx']:
-                icon = "📊"
-            elif ext in ['.json']:
-                icon = "📋"
-            elif ext in ['.h', '.cpp', '.c']:
-                icon = "⚙️"
-            elif ext in ['.xcscheme']:
-                icon = "🔧"
-            else:
-                icon = "📄"
-            
-            ai_bubble_html += self._result_row_html(file_name, hit.path, meta, icon)
+        # Add the first chunk of files in a clean list (like main page); the rest wait for a click
+        parts.extend(self._result_rows_chunk(hits))
         
         # Close the file list container
-        ai_bubble_html += """
-                </div>
-            </div>
-        </div>
-        """
+        parts.append(_RESULTS_BUBBLE_CLOSE_HTML)
         
         # Append to chat view
-        self.chat_view.append(ai_bubble_html)
+        self.chat_view.append("".join(parts))
+
+    def _result_rows_chunk(self, hits: List[FileHit]) -> List[str]:
+        """Row HTML for the next CHAT_RESULT_ROWS hits, plus a "Show more" link if any remain."""
+        rows = []
+        for hit in hits[:CHAT_RESULT_ROWS]:
+            ext, _dir, _base, _parent, file_name = self._parts_of(hit.path)
+            # Rows show the size only; the date was formatted here and then discarded
+            meta = self._format_file_size(hit.size)
+            
+            # Determine file icon based on extension
+            icon = _EXT_ICON.get(ext, _DEFAULT_FILE_ICON)
+            
+            rows.append(self._result_row_html(file_name, hit.path, meta, icon))
+        rest = hits[CHAT_RESULT_ROWS:]
+        if rest:
+            self._expand_seq += 1
+            self._pending_expands[self._expand_seq] = rest
+            rows.append(_SHOW_MORE_HTML % {"turn": self._expand_seq, "count": len(rest)})
+        return rows
+
+    def _expand_results(self, url: QUrl):
+        """Swap a turn's "Show more" link for its next chunk of rows, in place."""
+        href = url.toString()
+        try:
+            rest = self._pending_expands.pop(int(parse_qs(url.query()).get("turn", ["0"])[0]))
+        except (KeyError, ValueError):
+            return
+        doc = self.chat_view.document()
+        text = f"Show {len(rest)} more…"
+        cursor = doc.find(text, doc.characterCount() - 1, _FIND_BACKWARD)
+        # The same label can appear in several turns; the href tells them apart
+        while not cursor.isNull() and cursor.charFormat().anchorHref() != href:
+            cursor = doc.find(text, cursor.selectionStart(), _FIND_BACKWARD)
+        if not cursor.isNull():
+            cursor.insertHtml("".join(self._result_rows_chunk(rest)))
     
+    def _parts_of(self, path: str) -> tuple:
+        """_path_parts(path), cached in self._hit_parts."""
+        parts = self._hit_parts.get(path)
+        if parts is None:
+            if len(self._hit_parts) > HIT_PARTS_CACHE_SIZE:
+                self._hit_parts.clear()
+            parts = self._hit_parts[path] = _path_parts(path)
+        return parts
+
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        # Unit index straight from the bit length (each unit is 2**10), capped at GB
+        i = min((size_bytes.bit_length() - 1) // 10, 3)
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
     
     def _format_file_date(self, timestamp: float) -> str:
         """Format file date in human readable format."""
-        from datetime import datetime
         dt = datetime.fromtimestamp(timestamp)
         now = datetime.now()
         diff = now - dt
@@ -1442,73 +1871,91 @@ class SpotlightUI(QWidget):
             time_window = getattr(self, '_last_time_range', None)
             file_types = getattr(self, '_last_file_types', None)
             folders = getattr(self, '_last_folders', None)
+            # A newer search supersedes any rerank still queued or running
+            prev = getattr(self, '_rerank', None)
+            if prev is not None:
+                prev.cancel()
+            # Same query over the same hits and guardrails: reuse the model's earlier answer
+            key = (
+                query.strip().lower(),
+                tuple((h.path, h.score, h.mtime, h.size) for h in hits),
+                time_window, tuple(file_types or ()), tuple(folders or ()),
+            )
+            cached = self._rerank_cache.get(key)
+            if cached is not None:
+                self._rerank_cache.move_to_end(key)
+                self._apply_hits(self._conditioned_rerank(cached))
+                return
             self._rerank = RerankWorker(self.ai, query, hits, time_window, file_types, folders)
-            self._rerank.reranked.connect(lambda hh: self._apply_hits(self._conditioned_rerank(hh)))
+            self._rerank.reranked.connect(lambda hh, key=key: self._on_reranked(key, hh))
             self._rerank.start()
         except Exception:
             self._apply_hits(self._conditioned_rerank(hits))
 
+    def _on_reranked(self, key: tuple, hits: List[FileHit]):
+        self._rerank_cache[key] = hits
+        self._rerank_cache.move_to_end(key)
+        while len(self._rerank_cache) > RERANK_CACHE_SIZE:
+            self._rerank_cache.popitem(last=False)
+        self._apply_hits(self._conditioned_rerank(hits))
+
     def _conditioned_rerank(self, hits: List[FileHit]) -> List[FileHit]:
         try:
-            kws = getattr(self, '_last_keywords', []) or []
+            kws = [k.lower() for k in (getattr(self, '_last_keywords', []) or [])]
             exts = set((getattr(self, '_last_file_types', []) or []))
             folders = set((getattr(self, '_last_folders', []) or []))
             tspan = getattr(self, '_last_time_range', None)
-
-            def meets_all(h: FileHit) -> bool:
-                if exts and os.path.splitext(h.path)[1].lower() not in exts:
-                    return False
-                if folders:
-                    depth = getattr(self, '_last_folder_depth', 'any')
-                    if depth == 'exact':
-                        if not any(os.path.dirname(h.path) == f for f in folders):
-                            return False
-                    else:
-                        if not any(h.path.startswith(f + os.sep) or h.path == f for f in folders):
-                            return False
-                base = os.path.basename(h.path).lower(); parent = os.path.basename(os.path.dirname(h.path)).lower()
-                if kws and not any(k.lower() in base or k.lower() in parent for k in kws):
-                    return False
-                if tspan and isinstance(tspan, tuple) and all(tspan):
-                    s, e = tspan
-                    if not (s <= h.mtime <= e):
-                        return False
-                return True
-
-            def meets_partial(h: FileHit) -> int:
-                score = 0
-                base = os.path.basename(h.path).lower(); parent = os.path.basename(os.path.dirname(h.path)).lower()
-                if exts and os.path.splitext(h.path)[1].lower() in exts: score += 1
-                if folders:
-                    depth = getattr(self, '_last_folder_depth', 'any')
-                    if depth == 'exact':
-                        if any(os.path.dirname(h.path) == f for f in folders): score += 1
-                    else:
-                        if any(h.path.startswith(f + os.sep) or h.path == f for f in folders): score += 1
-                if kws and any(k.lower() in base or k.lower() in parent for k in kws): score += 1
-                if tspan and isinstance(tspan, tuple) and all(tspan):
-                    s, e = tspan
-                    if s <= h.mtime <= e: score += 1
-                return score
-
+            # No conditions: every hit would land in `full`, in its current order
+            if not (exts or folders or kws or tspan):
+                return hits
+            # One alternation scan per name instead of a Python-level `in` per keyword
+            kw_search = re.compile("|".join(map(re.escape, kws))).search if kws else None
+            depth = getattr(self, '_last_folder_depth', 'any')
+            # str.startswith takes a tuple, so "under any of these folders" is one C-level call
+            folder_prefixes = tuple(f + os.sep for f in folders)
+            use_time = bool(tspan and isinstance(tspan, tuple) and all(tspan))
+            if use_time:
+                t0, t1 = tspan
+
+            # Each condition is evaluated once per hit: matching all of the active ones puts the
+            # hit in `full`, matching some ranks it in `partial` by how many it matched
+            parts_cache = self._hit_parts
+            if len(parts_cache) > HIT_PARTS_CACHE_SIZE:
+                parts_cache.clear()
             full = []; partial = []; rest = []
             for h in hits:
-                if meets_all(h): full.append(h)
-                else:
-                    p = meets_partial(h)
-                    if p > 0: partial.append((p, h))
-                    else: rest.append(h)
+                path = h.path
+                parts = parts_cache.get(path)
+                if parts is None:
+                    parts = parts_cache[path] = _path_parts(path)
+                ext, parent_dir, base, parent, _name = parts
+                active = matched = 0
+                if exts:
+                    active += 1
+                    if ext in exts: matched += 1
+                if folders:
+                    active += 1
+                    if depth == 'exact':
+                        if parent_dir in folders: matched += 1
+                    elif path in folders or path.startswith(folder_prefixes):
+                        matched += 1
+                if kw_search:
+                    active += 1
+                    if kw_search(base) or kw_search(parent): matched += 1
+                if use_time:
+                    active += 1
+                    if t0 <= h.mtime <= t1: matched += 1
+                if matched == active: full.append(h)
+                elif matched: partial.append((matched, h))
+                else: rest.append(h)
 
             partial_sorted = [h for _p, h in sorted(partial, key=lambda x: x[0], reverse=True)]
-            ordered = full + partial_sorted + rest
             # If any conditions were specified, hide items that match zero conditions
             if (exts or folders or kws or tspan):
                 if not (full or partial):
                     return []
                 return full + partial_sorted
-            if (exts or folders or kws or tspan) and not (full or partial):
-                return []
-            return ordered
+            return full + partial_sorted + rest
         except Exception:
             return hits
 
@@ -1519,6 +1966,7 @@ class SpotlightUI(QWidget):
         if not h: return
         os_open(h.path)
     def _update_preview(self):
+        self._preview_timer.stop()  # direct calls supersede a pending debounced one
         h=self._selected_hit()
         print(f"DEBUG: _update_preview called, selected hit: {h}")
         if h: 
@@ -1538,7 +1986,7 @@ class SpotlightUI(QWidget):
         target_path = None
         # Prefer the file currently shown in the visible preview pane
         try:
-            if self.stack.currentIndex() == 1 and hasattr(self, 'conversation_preview') and getattr(self.conversation_preview, '_current_file', None):
+            if self.stack.currentIndex() == 1 and self.conversation_preview is not None and getattr(self.conversation_preview, '_current_file', None):
                 target_path = self.conversation_preview._current_file  # type: ignore[attr-defined]
                 print(f"DEBUG: Using conversation preview current file: {target_path}")
             elif hasattr(self, 'preview') and getattr(self.preview, '_current_file', None):
@@ -1559,7 +2007,7 @@ class SpotlightUI(QWidget):
                     target_path = selected_item.path
             else:
                 # If no file selected in conversation, check if there's a file in the conversation preview
-                if hasattr(self, 'conversation_preview') and getattr(self.conversation_preview, '_current_file', None):
+                if self.conversation_preview is not None and getattr(self.conversation_preview, '_current_file', None):
                     target_path = self.conversation_preview._current_file  # type: ignore[attr-defined]
         
         # If still no file found, try main search mode
@@ -1640,18 +2088,12 @@ class SpotlightUI(QWidget):
         preview_pane.btn_summarize.setText("Summarize")
         
         # Replace the "Summarizing..." message with the actual summary in chat
-        current_html = self.chat_view.toHtml()
-        
         if summary and summary.strip():
             summary_html = f"Here's a summary of {name}:\n\n{summary}"
         else:
             summary_html = f"Summary unavailable for {name}. The file may not contain text content suitable for summarization."
         
-        # Replace the "Summarizing..." message with the summary
-        updated_html = current_html.replace("Summarizing...", summary_html)
-        
-        # Update the chat view with the new content
-        self.chat_view.setHtml(updated_html)
+        self._replace_chat_text("Summarizing...", summary_html)
 
     def _handle_summarize_error(self, error_msg: str):
         """Handle summarization errors."""
@@ -1669,12 +2111,7 @@ class SpotlightUI(QWidget):
         preview_pane.btn_summarize.setText("Summarize")
         
         # Replace the "Summarizing..." message with error in chat
-        current_html = self.chat_view.toHtml()
-        error_html = f"Error: {error_msg}"
-        updated_html = current_html.replace("Summarizing...", error_html)
-        
-        # Update the chat view with the error message
-        self.chat_view.setHtml(updated_html)
+        self._replace_chat_text("Summarizing...", f"Error: {error_msg}")
 
     def _open_chat_with_summary(self, name: str, path: str, summary: str):
         self.chat_spinner.stop()
@@ -1685,15 +2122,7 @@ class SpotlightUI(QWidget):
         self._update_conversation_mode_indicator()
         
         # Replace the "Summarizing…" message with the actual summary
-        # Get the current HTML content
-        current_html = self.chat_view.toHtml()
-        
-        # Replace the "Summarizing…" message with the summary
-        summary_html = f"Here's a summary of {name}:\n\n{summary}"
-        updated_html = current_html.replace("Summarizing…", summary_html)
-        
-        # Update the chat view with the new content
-        self.chat_view.setHtml(updated_html)
+        self._replace_chat_text("Summarizing…", f"Here's a summary of {name}:\n\n{summary}")
         
         # Show file in preview
         self.conversation_preview.set_file(path, self.ai_mode)
@@ -1714,7 +2143,6 @@ class SpotlightUI(QWidget):
     
     def handle_chat_link(self, url: QUrl, action="preview"):
         """Handle clicks on chat links."""
-        from urllib.parse import parse_qs, unquote
         import subprocess
         import platform
         
@@ -1733,6 +2161,9 @@ class SpotlightUI(QWidget):
                 else:
                     # Show preview
                     self._show_preview_for(path)
+            elif url.host() == "expand":
+                # luma://expand?turn=N
+                self._expand_results(url)
             elif url.host() == "rag":
                 # luma://rag?action=init
                 action_param = (parse_qs(url.query()).get("action", [""])[0]).lower()
@@ -1744,7 +2175,7 @@ class SpotlightUI(QWidget):
     
     def _show_preview_for(self, path: str):
         """Show preview for the given file path."""
-        if hasattr(self, 'conversation_preview'):
+        if self.conversation_preview is not None:
             self.conversation_preview.set_file(path, self.ai_mode)
             self.conversation_preview.show()
             # Update the current selection
@@ -1811,7 +2242,7 @@ class SpotlightUI(QWidget):
             # Add user bubble/spinner only for file-specific path
             self._add_user_message(q)
             self.chat_spinner.start()
-            self.chat_view.append("AI is thinking…\n")
+            self._append_thinking_line()
             self._qa_worker = QnAWorker(self.ai, self._current_chat_file, q)
             self._qa_worker.answer_ready.connect(self._apply_answer)
             self._qa_worker.start()
@@ -1824,12 +2255,7 @@ class SpotlightUI(QWidget):
         self.chat_spinner.stop()
         
         # Remove the "AI is thinking..." message
-        cursor = self.chat_view.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.select(cursor.SelectionType.BlockUnderCursor)
-        if "AI is thinking…" in cursor.selectedText():
-            cursor.removeSelectedText()
-            cursor.deletePreviousChar()
+        self._remove_thinking_line()
         
         # Add AI response with proper styling
         self._add_ai_message(a)
@@ -1843,219 +2269,58 @@ class SpotlightUI(QWidget):
         # Hide summarize button since we're in No AI mode
         self.preview.btn_summarize.setVisible(False)
         # Also hide summarize button in conversation preview
-        if hasattr(self, 'conversation_preview'):
+        if self.conversation_preview is not None:
             self.conversation_preview.btn_summarize.setVisible(False)
         # Update summarize button visibility for both previews
         self.preview.update_summarize_button_visibility(self.ai_mode)
-        if hasattr(self, 'conversation_preview'):
+        if self.conversation_preview is not None:
             self.conversation_preview.update_summarize_button_visibility(self.ai_mode)
         # Hide folder selection controls on No AI page
-        if hasattr(self, 'folder_btn'):
+        if self.folder_btn is not None:
             self.folder_btn.setVisible(False)
-        if hasattr(self, 'folder_chip'):
+        if self.folder_chip is not None:
             self.folder_chip.setVisible(False)
-        if hasattr(self, 'chat_folder_btn'):
+        if self.chat_folder_btn is not None:
             self.chat_folder_btn.setVisible(False)
-        if hasattr(self, 'chat_folder_chip'):
+        if self.chat_folder_chip is not None:
             self.chat_folder_chip.setVisible(False)
-        if hasattr(self, 'folder_dropdown'):
+        if self.folder_dropdown is not None:
             self.folder_dropdown.setVisible(False)
         # Resize back to search mode
         self.resize(700, 160)
         self.setMinimumSize(700, 160)
         self.setMaximumSize(700, 800)
+        self._is_expanded = None
         # Update UI texts to reflect No AI mode
         self._update_ui_texts()
         # Update mode display after a short delay to ensure it's not overridden
         QTimer.singleShot(100, self._update_conversation_mode_indicator)
 
     def _apply_style(self):
-        self.setStyleSheet("""
-        QWidget#wrapper {background: white; border-radius: 16px; border: none;}
-        QWidget {background: transparent;}
-        
-        /* Integrated search container */
-        QWidget#searchContainer {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
-        
-        /* Main search input */
-        QLineEdit#mainSearch {background: transparent; border: none; padding: 8px 12px; color: #111; selection-background-color: #bcd4ff; font-size: 16px; font-weight: 400;}
-        QLineEdit#mainSearch:focus {background: transparent;}
-        
-        /* AI mode button */
-        QPushButton#aiModeButton {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1); padding: 8px 12px; color: #666; font-size: 13px; font-weight: 500;}
-        QPushButton#aiModeButton:hover {background: rgba(0,0,0,0.05); color: #333;}
-        QPushButton#aiModeButton:pressed {background: rgba(0,0,0,0.1);}
-        
-        /* Spinner holder (replaces Tab button) */
-        QWidget#spinnerHolder {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1);}
-        
-        /* Settings button */
-        QPushButton#settingsButton {background: transparent; border: none; border-left: 1px solid rgba(0,0,0,0.1); padding: 8px; color: #666; font-size: 16px; font-weight: 500;}
-        QPushButton#settingsButton:hover {background: rgba(0,0,0,0.05); color: #333;}
-        QPushButton#settingsButton:pressed {background: rgba(0,0,0,0.1);}
-        QPushButton#settingsButton QIcon {background: transparent;}
-        
-        /* AI dropdown menu - popup window style */
-        QWidget#aiDropdown {background: rgba(45, 55, 72, 0.95); border: 1px solid rgba(255,255,255,0.1); border-radius: 12px; box-shadow: 0 10px 25px rgba(0,0,0,0.3);}
-        
-        /* Dropdown options - dark popup style */
-        QPushButton#dropdownOption {background: rgba(255, 255, 255, 0.1); border: 1px solid rgba(255,255,255,0.1); padding: 12px 16px; color: #e5e7eb; font-size: 14px; font-weight: 500; text-align: left; border-radius: 8px; margin: 3px;}
-        QPushButton#dropdownOption:hover {background: rgba(59, 130, 246, 0.3); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.5);}
-        QPushButton#dropdownOption:pressed {background: rgba(59, 130, 246, 0.4); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.6);}
-        QPushButton#dropdownOption:checked {background: rgba(59, 130, 246, 0.35); color: #ffffff; border: 1px solid rgba(59, 130, 246, 0.55);}
-        
-        /* Settings page styles */
-        QFrame#settingsSection {background: white; border-radius: 12px; border: 1px solid rgba(0,0,0,0.12); box-shadow: 0 4px 12px rgba(0,0,0,0.08); margin: 8px 0px;}
-        QLabel#settingsLabel {color: #333; font-size: 18px; font-weight: 600; margin-bottom: 16px; padding: 12px 0px; margin-top: 16px;}
-        QLabel#settingsDescription {color: #666; font-size: 14px; font-weight: 400; margin-top: 8px; padding: 4px 0px; line-height: 1.4;}
-        QComboBox#settingsCombo {background: white; border: 2px solid rgba(0,0,0,0.15); border-radius: 8px; padding: 12px 16px; color: #333; font-size: 14px; font-weight: 500;}
-        QComboBox#settingsCombo:hover {border-color: rgba(59, 130, 246, 0.6); background: rgba(59, 130, 246, 0.02);}
-        QComboBox#settingsCombo:focus {border-color: #3b82f6; box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.15);}
-        QComboBox#settingsCombo::drop-down {border: none; width: 20px;}
-        QComboBox#settingsCombo::down-arrow {image: none; border: none; width: 0; height: 0; border-left: 5px solid transparent; border-right: 5px solid transparent; border-top: 5px solid #666;}
-        
-        QListView {background: white; border: none; padding: 0px; color: #222; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
-        QWidget#leftPane {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
-        QWidget#previewPane {background: white; border-radius: 16px; box-shadow: 0 4px 16px rgba(0,0,0,0.08);}
-        QWidget#previewPane QLabel {background: white; color: #222;}
-        QWidget#previewPane QFrame#thumbCard {background: white; border-radius: 8px; border: 1px solid rgba(0,0,0,0.06);}
-        QWidget#previewPane QTextEdit {background: white; border: 1px solid rgba(0,0,0,0.08); border-radius: 8px; padding: 8px; color: #222;}
-        QWidget#previewPane QPushButton {background: #3b82f6; color: white; border: none; border-radius: 8px; padding: 6px 12px; font-weight: 600;}
-        QWidget#previewPane QPushButton:hover {background: #2563eb;}
-        QWidget#previewPane QPushButton:pressed {background: #1d4ed8;}
-        QListView::item {border-radius: 12px; padding: 8px 8px 8px 24px; margin: 3px 0px 3px 0px;}
-        QListView::item:selected {background: rgba(59, 130, 246, 0.08); border: none; border-radius: 12px;}
-        QLabel#metaHeader {color:#4a4a4a; font-size:12px; font-weight:600; margin: 8px 0 4px 0;}
-        QLabel#metaLabel {color:#6f6f6f; font-size:11px;}
-        QLabel#metaValue {color:#111; font-size:11px;}
-        QWidget#rowContainer {border: none; background: white;}
-        QFrame#rowSep {background: rgba(0,0,0,0.08); min-height: 1px; max-height: 1px; margin-top: 6px;}
-        QFrame#thumbCard {background: white; border: none; border-radius: 0px;}
-        QSplitter::handle {background: rgba(0,0,0,0.06);}
-        
-        /* Conversation Mode Styles - Matching Main Page */
-        QWidget#chatHeader {
-            background: transparent;
-            border: none;
-            border-radius: 0px;
-        }
-        
-        QPushButton#chatBackButton {
-            background: transparent;
-            border: none;
-            color: #6b7280;
-            font-size: 18px;
-            font-weight: 600;
-            border-radius: 8px;
-        }
-        QPushButton#chatBackButton:hover {
-            background: rgba(0,0,0,0.05);
-            color: #374151;
-        }
-        QPushButton#chatBackButton:pressed {
-            background: rgba(0,0,0,0.1);
-        }
-        
-        QLabel#chatModeDisplay {
-            background: transparent;
-            border: none;
-            border-left: 1px solid rgba(0,0,0,0.1);
-            color: #6b7280;
-            font-size: 13px;
-            font-weight: 500;
-            padding: 8px 12px;
-            text-align: center;
-            min-width: 140px;
-            line-height: 1.2;
-        }
-
-        QLabel#folderChip {background: rgba(59,130,246,0.08); border: 1px solid rgba(59,130,246,0.25); border-radius: 10px; padding: 4px 8px; color: #1e40af; font-size: 12px; margin-left: 6px; min-height: 24px;}
-        
-        QWidget#chatSpinnerHolder {
-            background: transparent;
-            border: none;
-        }
-        
-        QWidget#conversationWidget {
-            background: #ffffff;
-            border-radius: 0px;
-        }
-        
-        QTextEdit#conversationView {
-            background: #ffffff;
-            border: none;
-            border-radius: 0px;
-            padding: 16px;
-            color: #1e293b;
-            font-size: 14px;
-            line-height: 1.5;
-        }
-        
-        /* Chat bubble styling */
-        QTextEdit#conversationView a {
-            text-decoration: none;
-            color: #3b82f6;
-        }
-        
-        QTextEdit#conversationView a:hover {
-            text-decoration: underline;
-        }
-        
-        /* Button styling within chat */
-        QTextEdit#conversationView button {
-            background: #f1f5f9;
-            border: 1px solid #d1d5db;
-            border-radius: 6px;
-            padding: 4px 8px;
-            font-size: 11px;
-            color: #374151;
-        }
-        
-        QTextEdit#conversationView button:hover {
-            background: #e5e7eb;
-        }
-        
-        QLineEdit#mainChatInput {
-            background: transparent;
-            border: none;
-            padding: 8px 12px;
-            color: #111;
-            selection-background-color: #bcd4ff;
-            font-size: 16px;
-            font-weight: 400;
-        }
-        QLineEdit#mainChatInput:focus {
-            background: transparent;
-        }
-        
-        QWidget#conversationPreview {
-            background: white;
-            border-left: 1px solid rgba(0,0,0,0.08);
-            border-radius: 0px;
-        }
-        
-        QSplitter#conversationSplitter::handle {
-            background: rgba(0,0,0,0.08);
-            width: 1px;
-        }
-        QSplitter#conversationSplitter::handle:hover {
-            background: rgba(59, 130, 246, 0.3);
-        }
-        """)
+        # The sheet is a module constant so every window shares one string; only
+        # re-apply when it differs to skip a redundant style re-polish.
+        if self.styleSheet() != SPOTLIGHT_QSS:
+            self.setStyleSheet(SPOTLIGHT_QSS)
 
     # ---------------- Warmup -----------------
     # Warmup worker moved to luma_mod.ui.workers
 
     def _warmup_ai(self):
+        # One warmup per backend: the model load / connection it primes outlives the LumaAI
+        # instance, so flipping Private <-> Cloud must not stack up repeat warmups.
+        # A failed warmup (e.g. Ollama not running yet) un-marks the mode so it is retried.
+        mode = self.ai.mode
+        if mode in self._warmed_modes:
+            return
+        self._warmed_modes.add(mode)
         try:
-            self._warm = WarmupWorker(self.ai)
-            self._warm.start()
+            WarmupWorker(self.ai, on_failure=lambda: self._warmed_modes.discard(mode)).start()
         except Exception:
-            pass
+            self._warmed_modes.discard(mode)
 
     def _populate_language_combo(self):
         """Populate the language combo box with available languages."""
-        tm = get_translation_manager()
+        tm = self._tm
         available_languages = tm.get_available_languages()
         
         for lang_code, lang_name in available_languages.items():
@@ -2068,99 +2333,114 @@ class SpotlightUI(QWidget):
                 self.language_combo.setCurrentIndex(i)
                 break
     
-    def _on_language_changed(self, text: str):
-        """Handle language change from the combo box."""
-        # Extract language code from the text (e.g., "English (en)" -> "en")
-        lang_code = self.language_combo.currentData()
+    def _on_language_changed(self, index: int):
+        """Handle a user-initiated language change from the combo box."""
+        lang_code = self.language_combo.itemData(index)
         if lang_code:
-            tm = get_translation_manager()
-            if tm.set_language(lang_code):
-                self._update_ui_texts()
+            if self._tm.set_language(lang_code):
+                self.languageChanged.emit()
 
     def _open_rag_folder_dialog(self):
         """Multi-folder chooser for RAG indexing with clear guidance."""
         pass
 
+    def _bind_texts(self, *bindings):
+        """Register (key, setters) pairs for retranslation and apply them now."""
+        self._text_bindings.extend(bindings)
+        for key, setters in bindings:
+            text = tr(key)
+            for setter in setters:
+                setter(text)
+
+    def _rebuild_ai_mode_texts(self):
+        """Cache translated labels that depend on the AI mode; they only change with the language."""
+        self._ai_mode_texts = {"none": tr("ask_ai"), "private": tr("private_mode"), "cloud": tr("cloud_mode")}
+        self._search_placeholders = {"none": tr("search_placeholder_auto")}
+        self._search_placeholder_enter = tr("search_placeholder_enter")
+
+    def _retranslate_static_texts(self):
+        """Apply the registered key -> setter table; only needed when the language changes."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.setWindowTitle(tr("app_title"))
+            for key, setters in self._text_bindings:
+                text = tr(key)
+                for setter in setters:
+                    setter(text)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
     def _update_ui_texts(self):
-        """Update all UI texts with current translations."""
-        # Store current language selection to preserve it
-        current_lang_code = None
-        if hasattr(self, 'language_combo') and self.language_combo.count() > 0:
-            current_lang_code = self.language_combo.currentData()
-        
-        # Update window title
-        self.setWindowTitle(tr("app_title"))
-        
-        # Update search placeholder based on AI mode
-        if hasattr(self, 'search'):
-            if self.ai_mode == "none":
-                self.search.setPlaceholderText(tr("search_placeholder_auto"))
-            else:
-                self.search.setPlaceholderText(tr("search_placeholder_enter"))
-        
-        # Update AI mode button
-        if hasattr(self, 'ai_mode_button'):
-            if self.ai_mode == "none":
-                self.ai_mode_button.setText(tr("ask_ai"))
-            elif self.ai_mode == "private":
-                self.ai_mode_button.setText(tr("private_mode"))
-            elif self.ai_mode == "cloud":
-                self.ai_mode_button.setText(tr("cloud_mode"))
-        # Populate quick folder list with defaults + chosen
-        if hasattr(self, 'folder_list'):
-            self.folder_list.clear()
-            known = list(dict.fromkeys([*self._rag_folders, *DEFAULT_FOLDERS]))
-            for p in known:
-                self.folder_list.addItem(p)
-        
-        # Update dropdown options
-        if hasattr(self, 'no_ai_btn'):
-            self.no_ai_btn.setText(tr("no_ai"))
-        if hasattr(self, 'private_mode_btn'):
-            self.private_mode_btn.setText(tr("private_mode"))
-        if hasattr(self, 'cloud_mode_btn'):
-            self.cloud_mode_btn.setText(tr("cloud_mode"))
-        
-        # Update chat page (only if elements exist)
-        if hasattr(self, 'lbl_chat_title'):
-            self.lbl_chat_title.setText(tr("ask_follow_up"))
-        if hasattr(self, 'chat_input'):
-            # Force friendly placeholder regardless of previous state
-            self.chat_input.setPlaceholderText(tr("ask_follow_up"))
-        if hasattr(self, 'chat_send'):
-            self.chat_send.setText(tr("send"))
-        
-        # Update settings page (only if elements exist)
-        if hasattr(self, 'lbl_settings_title'):
-            self.lbl_settings_title.setText(tr("settings"))
-        if hasattr(self, 'lbl_language'):
-            self.lbl_language.setText(tr("language"))
-        
-        # Update tooltips
-        if hasattr(self, 'settings_btn'):
-            self.settings_btn.setToolTip(tr("settings"))
-        
-        # Restore language selection if it was preserved
-        if current_lang_code and hasattr(self, 'language_combo'):
-            for i in range(self.language_combo.count()):
-                if self.language_combo.itemData(i) == current_lang_code:
-                    self.language_combo.setCurrentIndex(i)
-                    break
+        """Refresh UI texts that depend on the AI mode and folder selection."""
+        # Coalesce the setText/setPlaceholderText calls below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Widgets are created once in __init__; nothing to refresh before that
+            if not self._widgets_built:
+                return
+
+            # Store current language selection to preserve it
+            current_lang_code = None
+            if self.settings_page is not None and self.language_combo.count() > 0:
+                current_lang_code = self.language_combo.currentData()
+        
+            # Update search placeholder based on AI mode
+            self.search.setPlaceholderText(self._search_placeholders.get(self.ai_mode, self._search_placeholder_enter))
+        
+            # Update AI mode button
+            self.ai_mode_button.setText(self._ai_mode_texts[self.ai_mode])
+            # Populate quick folder list with defaults + chosen
+            # (rebuilt only when the entries change; otherwise just drop the stale selection)
+            if self.folder_dropdown is not None:
+                known = tuple(dict.fromkeys([*self._rag_folders, *DEFAULT_FOLDERS]))
+                if known != self._folder_list_known or self.folder_list.count() != len(known):
+                    self.folder_list.clear()
+                    self.folder_list.addItems(known)
+                    self._folder_list_known = known
+                else:
+                    self.folder_list.clearSelection()
+        
+            # Restore language selection if it was preserved
+            # (signals blocked so the restore does not re-enter _on_language_changed)
+            if current_lang_code:
+                cb = self.language_combo
+                i = cb.findData(current_lang_code)
+                if i >= 0 and i != cb.currentIndex():
+                    cb.blockSignals(True)
+                    try:
+                        cb.setCurrentIndex(i)
+                    finally:
+                        cb.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _show_settings(self):
         """Show settings page with proper sizing."""
+        if self.settings_page is None:
+            self._build_settings_page()
         self.stack.setCurrentIndex(2)
-        # Resize window to accommodate settings content
-        self.resize(700, 600)  # Even taller for settings
-        self.setMinimumSize(700, 600)
-        self.setMaximumSize(700, 700)
+        # Resize window to accommodate settings content; batch geometry changes into one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.setFixedSize(700, 600)  # Even taller for settings
+            self.setMaximumHeight(700)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._is_expanded = None
     
     def _hide_settings(self):
         """Hide settings page and return to search."""
         self.stack.setCurrentIndex(0)
         # Return to normal search size
-        self.resize(700, 160)
-        self.setMinimumSize(700, 160)
-        self.setMaximumSize(700, 800)
+        self.setUpdatesEnabled(False)
+        try:
+            self.setMinimumSize(700, 160)
+            self.setMaximumSize(700, 800)
+            self.resize(700, 160)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._is_expanded = None
 
 
@@ -6,11 +6,16 @@ from typing import List, Optional
 
 from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QFileInfo
 from PyQt6.QtWidgets import QFileIconProvider, QStyledItemDelegate, QStyleOptionViewItem
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QFont, QFontMetrics
 
 from .utils import human_size, elide_middle
 
 
+# Extensions whose icon belongs to the individual file (app bundles, executables, shortcuts),
+# plus no extension at all; everything else shares one icon per extension
+_PER_FILE_ICON_EXTS = {"", ".app", ".exe", ".lnk", ".url", ".ico", ".icns"}
+
+
 @dataclass
 class FileHit:
     path: str; score: int; mtime: float; size: int
@@ -19,26 +24,69 @@ class FileHit:
 class ResultsModel(QAbstractListModel):
     def __init__(self):
         super().__init__(); self._items: List[FileHit]=[]; self._icon=QFileIconProvider()
+        # Column arrays filled once per set_items so data()/paint() index lists
+        # instead of re-reading FileHit attributes and re-splitting paths per row
+        self._paths: List[str]=[]; self._names: List[str]=[]; self._exts: List[str]=[]
+        self._metas: List[str]=[]; self._tips: List[str]=[]
+        # QFileIconProvider.icon hits the filesystem/icon theme; all .pdf files get the same icon
+        self._icon_cache: dict[str, QIcon]={}
     def rowCount(self, parent: QModelIndex=QModelIndex()) -> int: return len(self._items)  # type: ignore[override]
     def data(self, index: QModelIndex, role: int):  # type: ignore[override]
         if not index.isValid(): return None
-        h=self._items[index.row()]
-        if role==Qt.ItemDataRole.DisplayRole: return os.path.basename(h.path)
-        if role==Qt.ItemDataRole.ToolTipRole:
-            return f"{h.path}\nModified: {datetime.fromtimestamp(h.mtime):%Y-%m-%d %H:%M}\nSize: {human_size(h.size)}\nScore: {h.score}"
-        if role==Qt.ItemDataRole.DecorationRole: return self._icon.icon(QFileInfo(h.path))
+        row=index.row()
+        if role==Qt.ItemDataRole.DisplayRole: return self._names[row]
+        if role==Qt.ItemDataRole.DecorationRole: return self._icon_for(row)
+        if role==Qt.ItemDataRole.ToolTipRole: return self._tips[row]
         return None
-    def set_items(self, items: List[FileHit]): self.beginResetModel(); self._items=items; self.endResetModel()
+    def _icon_for(self, row: int) -> QIcon:
+        ext=self._exts[row]
+        if ext in _PER_FILE_ICON_EXTS: return self._icon.icon(QFileInfo(self._paths[row]))
+        ic=self._icon_cache.get(ext)
+        if ic is None: ic=self._icon_cache[ext]=self._icon.icon(QFileInfo(self._paths[row]))
+        return ic
+    def _fill_columns(self, items: List[FileHit]):
+        self._items=items
+        self._paths=[h.path for h in items]
+        self._names=[os.path.basename(p) for p in self._paths]
+        self._exts=[os.path.splitext(n)[1].lower() for n in self._names]
+        # Display strings are built here once rather than on every repaint/tooltip
+        sizes=[human_size(h.size) for h in items]
+        self._metas=[f"{elide_middle(os.path.dirname(p),42)}  •  {sz}" for p, sz in zip(self._paths, sizes)]
+        self._tips=[f"{h.path}\nModified: {datetime.fromtimestamp(h.mtime):%Y-%m-%d %H:%M}\nSize: {sz}\nScore: {h.score}"
+                    for h, sz in zip(items, sizes)]
+    def set_items(self, items: List[FileHit]):
+        # Identical result sets are common (cache hits, re-applied searches): skip them.
+        if items == self._items: return
+        # Same row count: swap in place and repaint, no reset/re-layout of the view
+        if self._items and len(items) == len(self._items):
+            self._fill_columns(items)
+            self.dataChanged.emit(self.index(0), self.index(len(items)-1)); return
+        self.beginResetModel(); self._fill_columns(items); self.endResetModel()
     def item(self, row:int)->Optional[FileHit]: return self._items[row] if 0<=row<len(self._items) else None
+    def row_text(self, row:int)->tuple[str, str]:
+        """(name, meta line) for a row, straight from the column arrays."""
+        return self._names[row], self._metas[row]
 
 
 class ResultDelegate(QStyledItemDelegate):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Title/meta fonts derived from the view font, rebuilt only when that font changes
+        self._base_font: Optional[QFont]=None; self._title_font=QFont(); self._meta_font=QFont()
+        self._title_fm: Optional[QFontMetrics]=None
+    def _sync_fonts(self, base: QFont):
+        if self._base_font is not None and base == self._base_font: return
+        self._base_font=QFont(base)
+        self._title_font=QFont(base); self._title_font.setPointSize(base.pointSize()+1); self._title_font.setBold(True)
+        self._meta_font=QFont(base); self._meta_font.setPointSize(base.pointSize()-1); self._meta_font.setBold(False)
+        self._title_fm=QFontMetrics(self._title_font)
     def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # type: ignore[override]
         return QSize(option.rect.width(),56)
     def paint(self, p, opt: QStyleOptionViewItem, idx: QModelIndex):  # type: ignore[override]
         from PyQt6.QtGui import QPainter
-        h: FileHit = idx.model().item(idx.row())  # type: ignore
-        if not h: return super().paint(p,opt,idx)
+        model=idx.model(); row=idx.row()
+        if model.item(row) is None: return super().paint(p,opt,idx)  # type: ignore
+        name, meta = model.row_text(row)  # type: ignore
         p.save(); r=opt.rect
         icon:QIcon = idx.data(Qt.ItemDataRole.DecorationRole)
         dpr = p.device().devicePixelRatioF() if hasattr(p.device(), 'devicePixelRatioF') else 1.0
@@ -48,18 +96,16 @@ class ResultDelegate(QStyledItemDelegate):
         pix = icon.pixmap(size_px, size_px)
         try: pix.setDevicePixelRatio(dpr)
         except Exception: pass
-        f=p.font(); f.setPointSize(f.pointSize()+1); f.setBold(True); p.setFont(f)
-        fm = p.fontMetrics()
+        self._sync_fonts(opt.font); p.setFont(self._title_font)
+        fm = self._title_fm
         base_y = r.top()+24
         text_mid_y = base_y - ((fm.ascent() - fm.descent()) / 2.0)
         icon_x = r.left()+12
         icon_y = int(text_mid_y - (icon_size/2))
         p.drawPixmap(icon_x, icon_y, pix)
-        name=os.path.basename(h.path)
-        meta=f"{elide_middle(os.path.dirname(h.path),42)}  •  {human_size(h.size)}"
         text_x = icon_x + icon_size + gap_px
         p.setPen(opt.palette.windowText().color()); p.drawText(text_x, r.top()+24, name)
-        f.setPointSize(f.pointSize()-2); f.setBold(False); p.setFont(f)
+        p.setFont(self._meta_font)
         p.setPen(opt.palette.mid().color()); p.drawText(text_x, r.top()+40, meta)
         p.restore()
 
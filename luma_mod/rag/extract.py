@@ -0,0 +1,152 @@
+"""Text extraction for the RAG indexer.
+
+Kept free of faiss/sentence-transformers imports: the indexer runs extract_file in
+spawned worker processes, and each worker imports only this module.
+"""
+from __future__ import annotations
+import os
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+SUPPORTED_EXTS = {
+    ".pdf", ".docx", ".pptx", ".txt", ".md", ".markdown", ".html", ".htm",
+}
+
+# When True, attempt to index all file types as text (with binary safeguards)
+INDEX_ALL_FILE_TYPES = True
+
+
+# Checked in order: the UTF-32 LE mark starts with the UTF-16 LE one
+_BOMS = (
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe\x00\x00", "utf-32"),
+    (b"\x00\x00\xfe\xff", "utf-32"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+
+def _decode_bytes(raw: bytes) -> str:
+    """Decode file contents: BOM, then strict UTF-8, and only then charset detection."""
+    for bom, enc in _BOMS:
+        if raw.startswith(bom):
+            return raw.decode(enc, errors="ignore")
+    try:
+        # Covers ASCII and UTF-8, i.e. nearly every text file, in one C-level pass
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    try:
+        from charset_normalizer import from_bytes  # type: ignore
+        best = from_bytes(raw).best()
+        if best is not None:
+            return str(best)
+    except Exception:
+        try:
+            # Older installs may only have chardet (pure Python, much slower on big files)
+            import chardet  # type: ignore
+            return raw.decode(chardet.detect(raw).get("encoding") or "utf-8", errors="ignore")
+        except Exception:
+            pass
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _html_to_text(html: str) -> str:
+    """Visible text of an HTML document: scripts/styles dropped, entities decoded."""
+    try:
+        # lexbor is the maintained backend (selectolax >= 0.3.13); 1.0 removed the modest one
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+    except Exception:
+        try:
+            from selectolax.parser import HTMLParser  # type: ignore
+        except Exception:
+            # dumb HTML strip
+            import re
+            return re.sub(r"<[^>]+>", " ", html)
+    tree = HTMLParser(html)
+    for tag in tree.css("script,style"):
+        tag.decompose()
+    root = tree.body if tree.body is not None else tree.root
+    return root.text(separator=" ") if root is not None else ""
+
+
+def load_text_from_file(path: str) -> Tuple[str, Optional[List[Tuple[int, str]]]]:
+    """Return (full_text, paged_items) where paged_items is list of (page_num, page_text) if applicable.
+    For PDFs/PPTX we return page-level items; for others, None.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".pdf":
+            from pypdf import PdfReader  # type: ignore
+            reader = PdfReader(path)
+            pages: List[Tuple[int, str]] = []
+            for i, p in enumerate(reader.pages):
+                try:
+                    pages.append((i + 1, p.extract_text() or ""))
+                except Exception:
+                    pages.append((i + 1, ""))
+            return ("\n\n".join(t for _, t in pages), pages)
+        if ext == ".docx":
+            import docx  # type: ignore
+            doc = docx.Document(path)
+            text = "\n".join(p.text for p in doc.paragraphs)
+            return (text, None)
+        if ext == ".pptx":
+            from pptx import Presentation  # type: ignore
+            prs = Presentation(path)
+            pages: List[Tuple[int, str]] = []
+            for i, slide in enumerate(prs.slides):
+                texts: List[str] = []
+                try:
+                    for shape in slide.shapes:
+                        if hasattr(shape, "text"):
+                            texts.append(str(shape.text))
+                except Exception:
+                    pass
+                pages.append((i + 1, "\n".join(texts)))
+            return ("\n\n".join(t for _, t in pages), pages)
+        if ext in {".txt", ".md", ".markdown"}:
+            with open(path, "rb") as f:
+                return (_decode_bytes(f.read()), None)
+        if ext in {".html", ".htm"}:
+            with open(path, "rb") as f:
+                return (_html_to_text(_decode_bytes(f.read())), None)
+        # Fallback: best-effort decode for any other type; skip binary-like files
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            head = raw[:8192]
+            # Null bytes strongly suggest binary
+            if b"\x00" in head:
+                return ("", None)
+            # Ratio of printable ASCII as a simple heuristic
+            printable = sum(1 for b in head if 32 <= b <= 126 or b in (9, 10, 13))
+            if len(head) > 0 and (printable / max(1, len(head))) < 0.6:
+                return ("", None)
+            return (_decode_bytes(raw), None)
+        except Exception:
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    return (f.read(), None)
+            except Exception:
+                return ("", None)
+    except Exception:
+        return ("", None)
+
+
+def extract_file(path: str) -> Optional[Tuple[str, str, Optional[List[Tuple[int, str]]]]]:
+    """(mtime_iso, full_text, paged_items) for a file, or None if it should be skipped.
+
+    Top-level and free of index state so ProcessPoolExecutor workers can run it.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if (not INDEX_ALL_FILE_TYPES) and (ext not in SUPPORTED_EXTS):
+        return None
+    try:
+        st = os.stat(path)
+        mtime_iso = datetime.fromtimestamp(st.st_mtime).isoformat()
+    except Exception:
+        return None
+    full_text, paged = load_text_from_file(path)
+    return mtime_iso, full_text, paged
@@ -4,10 +4,25 @@ import io
 import json
 import time
 import hashlib
+import sqlite3
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable, List, Tuple, Optional, Dict
+from typing import Iterable, Iterator, List, Tuple, Optional, Dict
+
+from ..config import get_rag_index_kind
+# Re-exported: callers (watcher, workers) import these from here
+from .extract import SUPPORTED_EXTS, INDEX_ALL_FILE_TYPES, extract_file, load_text_from_file
+
+__all__ = [
+    "SUPPORTED_EXTS", "INDEX_ALL_FILE_TYPES", "extract_file", "load_text_from_file",
+    "HAVE_FAISS", "HAVE_ST", "RAG_HOME", "FAISS_PATH", "META_PATH", "LEGACY_META_PATH", "META_COLUMNS",
+    "INDEX_BATCH_CHUNKS", "EMBED_BATCH_SIZE", "PARALLEL_EXTRACT_MIN_FILES", "EXTRACT_MAX_WORKERS",
+    "EXTRACT_WINDOW", "HNSW_M", "HNSW_EF_CONSTRUCTION", "HNSW_EF_SEARCH",
+    "ensure_dirs", "file_sig", "iter_files", "connect_meta", "remove_meta", "sha1_of_text",
+    "iter_extracted", "iter_sliding_windows", "MetaEntry", "RAGIndex", "read_meta_lines",
+]
 
 # External deps expected in requirements.txt
 try:
@@ -24,18 +39,52 @@ except Exception:
     SentenceTransformer = None  # type: ignore
     HAVE_ST = False
 
+# Optional: C-implemented JSON for importing a legacy meta.jsonl (stdlib json is the fallback)
+try:
+    import orjson  # type: ignore
+    HAVE_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    HAVE_ORJSON = False
+
 
 RAG_HOME = os.path.expanduser("~/.luma/rag_db")
 FAISS_PATH = os.path.join(RAG_HOME, "faiss.index")
-META_PATH = os.path.join(RAG_HOME, "meta.jsonl")
+META_PATH = os.path.join(RAG_HOME, "meta.db")
+# Sidecar format used before meta.db; imported into the database on first open
+LEGACY_META_PATH = os.path.join(RAG_HOME, "meta.jsonl")
+
+META_COLUMNS = ("id", "path", "folder", "mtime_iso", "page", "text_hash", "text", "deleted")
+_META_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY, path TEXT, folder TEXT, mtime_iso TEXT,"
+    " page INT, text_hash TEXT, text TEXT, deleted INT NOT NULL DEFAULT 0)",
+    "CREATE INDEX IF NOT EXISTS meta_path ON meta(path)",
+    "CREATE INDEX IF NOT EXISTS meta_text_hash ON meta(text_hash)",
+    # Signature of every indexed file, so unchanged files are neither extracted nor embedded again
+    "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, content_sha1 TEXT)",
+)
+
 
+# index_folders gathers chunks from many files and embeds/adds/persists them together
+INDEX_BATCH_CHUNKS = 4096
+EMBED_BATCH_SIZE = 256
 
-SUPPORTED_EXTS = {
-    ".pdf", ".docx", ".pptx", ".txt", ".md", ".markdown", ".html", ".htm",
-}
+# Text extraction (pypdf/docx/pptx/decoding) runs in worker processes for big jobs; below
+# this many files the cost of starting the workers outweighs the parallel speedup
+PARALLEL_EXTRACT_MIN_FILES = 64
+# Upper bound on extraction processes; each one holds a whole document's text at a time
+EXTRACT_MAX_WORKERS = 4
+# Files handed to the pool at a time, so extracted text does not pile up ahead of embedding
+EXTRACT_WINDOW = 256
 
-# When True, attempt to index all file types as text (with binary safeguards)
-INDEX_ALL_FILE_TYPES = True
+# HNSW graph parameters (LUMA_RAG_INDEX=hnsw): neighbours per node, build and query beam widths
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+
+def _json_loads(line: bytes):
+    return orjson.loads(line) if HAVE_ORJSON else json.loads(line)
 
 
 def ensure_dirs() -> None:
@@ -43,6 +92,102 @@ def ensure_dirs() -> None:
         os.makedirs(RAG_HOME, exist_ok=True)
 
 
+def file_sig(path: str) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def iter_files(roots: List[str], excludes: List[str]) -> Iterable[Tuple[str, Optional[Tuple[int, int]]]]:
+    """Yield (path, file_sig) for the indexable files under roots, recursively.
+
+    Same selection as os.walk with hidden and excluded folders pruned, but scandir's
+    entries carry the file type (and on Windows the stat result), so nothing is
+    stat'ed twice and filtered-out names cost no IO at all.
+    """
+    stack = [r for r in roots if os.path.isdir(r)]
+    stack.reverse()
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir():
+                    # Like os.walk, symlinked folders are not descended into
+                    if not name.startswith('.') and not any(x in name for x in excludes) and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+            except OSError:
+                continue
+            if name.startswith('.'):
+                continue
+            if not INDEX_ALL_FILE_TYPES and os.path.splitext(name)[1].lower() not in SUPPORTED_EXTS:
+                continue
+            try:
+                st = entry.stat()
+                sig = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                sig = None
+            yield entry.path, sig
+        stack.extend(reversed(subdirs))
+
+
+def _meta_row(obj: Dict[str, object]) -> Tuple[object, ...]:
+    return tuple(obj.get(c) for c in META_COLUMNS[:-1]) + (1 if obj.get("deleted") else 0,)
+
+
+def _import_legacy_meta(db: sqlite3.Connection) -> None:
+    """Move the records of an old meta.jsonl into the (new, empty) meta table."""
+    rows = []
+    with open(LEGACY_META_PATH, "rb") as r:
+        for line in r:
+            try:
+                rows.append(_meta_row(_json_loads(line)))
+            except Exception:
+                continue
+    with db:
+        # Later lines win for a repeated id, as they did when the JSONL was read into a dict
+        db.executemany("INSERT OR REPLACE INTO meta VALUES (?,?,?,?,?,?,?,?)", rows)
+    os.remove(LEGACY_META_PATH)
+
+
+def connect_meta() -> sqlite3.Connection:
+    """Open (creating if needed) the metadata database.
+
+    WAL lets searches read while an index run writes; synchronous=NORMAL only syncs at
+    checkpoints, which is safe in WAL mode and much faster for many small commits.
+    """
+    ensure_dirs()
+    db = sqlite3.connect(META_PATH, timeout=30, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    fresh = db.execute("SELECT name FROM sqlite_master WHERE name='meta'").fetchone() is None
+    with db:
+        for stmt in _META_SCHEMA:
+            db.execute(stmt)
+    if fresh and os.path.isfile(LEGACY_META_PATH):
+        try:
+            _import_legacy_meta(db)
+        except Exception:
+            traceback.print_exc()
+    return db
+
+
+def remove_meta() -> None:
+    """Delete the metadata database (with its WAL files) and any legacy JSONL sidecar."""
+    for p in (META_PATH, META_PATH + "-wal", META_PATH + "-shm", LEGACY_META_PATH):
+        if os.path.exists(p):
+            os.remove(p)
+
+
 def sha1_of_text(text: str, path: str, page: Optional[int]) -> str:
     normalized = " ".join(text.split())
     h = hashlib.sha1()
@@ -50,124 +195,72 @@ def sha1_of_text(text: str, path: str, page: Optional[int]) -> str:
     return h.hexdigest()
 
 
-def load_text_from_file(path: str) -> Tuple[str, Optional[List[Tuple[int, str]]]]:
-    """Return (full_text, paged_items) where paged_items is list of (page_num, page_text) if applicable.
-    For PDFs/PPTX we return page-level items; for others, None.
+def iter_extracted(paths: List[str]) -> Iterable[Tuple[str, object]]:
+    """Yield (path, extract_file(path)) in order, extracting in parallel for large lists.
+
+    Workers are spawned, never forked: this runs on a QThread of a process that also has
+    torch threads, and fork() there can deadlock on locks held by those threads. They only
+    import luma_mod.rag.extract, which pulls in neither faiss nor torch. Falls back to
+    in-process extraction if worker processes cannot be used (e.g. a frozen app without
+    multiprocessing support or a worker crash).
     """
-    ext = os.path.splitext(path)[1].lower()
-    try:
-        if ext == ".pdf":
-            from pypdf import PdfReader  # type: ignore
-            reader = PdfReader(path)
-            pages: List[Tuple[int, str]] = []
-            for i, p in enumerate(reader.pages):
-                try:
-                    pages.append((i + 1, p.extract_text() or ""))
-                except Exception:
-                    pages.append((i + 1, ""))
-            return ("\n\n".join(t for _, t in pages), pages)
-        if ext == ".docx":
-            import docx  # type: ignore
-            doc = docx.Document(path)
-            text = "\n".join(p.text for p in doc.paragraphs)
-            return (text, None)
-        if ext == ".pptx":
-            from pptx import Presentation  # type: ignore
-            prs = Presentation(path)
-            pages: List[Tuple[int, str]] = []
-            for i, slide in enumerate(prs.slides):
-                texts: List[str] = []
-                try:
-                    for shape in slide.shapes:
-                        if hasattr(shape, "text"):
-                            texts.append(str(shape.text))
-                except Exception:
-                    pass
-                pages.append((i + 1, "\n".join(texts)))
-            return ("\n\n".join(t for _, t in pages), pages)
-        if ext in {".txt", ".md", ".markdown"}:
-            # Try chardet to guess encoding
-            try:
-                import chardet  # type: ignore
-                with open(path, "rb") as f:
-                    raw = f.read()
-                enc = chardet.detect(raw).get("encoding") or "utf-8"
-                text = raw.decode(enc, errors="ignore")
-            except Exception:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    text = f.read()
-            return (text, None)
-        if ext in {".html", ".htm"}:
-            try:
-                import chardet  # type: ignore
-                with open(path, "rb") as f:
-                    raw = f.read()
-                enc = chardet.detect(raw).get("encoding") or "utf-8"
-                html = raw.decode(enc, errors="ignore")
-            except Exception:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    html = f.read()
-            # dumb HTML strip
-            import re
-            text = re.sub(r"<[^>]+>", " ", html)
-            return (text, None)
-        # Fallback: best-effort decode for any other type; skip binary-like files
+    done = 0
+    if len(paths) >= PARALLEL_EXTRACT_MIN_FILES:
         try:
-            import chardet  # type: ignore
-            with open(path, "rb") as f:
-                raw = f.read()
-            head = raw[:8192]
-            # Null bytes strongly suggest binary
-            if b"\x00" in head:
-                return ("", None)
-            # Ratio of printable ASCII as a simple heuristic
-            printable = sum(1 for b in head if 32 <= b <= 126 or b in (9, 10, 13))
-            if len(head) > 0 and (printable / max(1, len(head))) < 0.6:
-                return ("", None)
-            enc = chardet.detect(raw).get("encoding") or "utf-8"
-            text = raw.decode(enc, errors="ignore")
-            return (text, None)
+            workers = max(1, min(EXTRACT_MAX_WORKERS, os.cpu_count() or 1))
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+                for start in range(0, len(paths), EXTRACT_WINDOW):
+                    window = paths[start:start + EXTRACT_WINDOW]
+                    for path, res in zip(window, ex.map(extract_file, window, chunksize=8)):
+                        yield path, res
+                        done += 1
         except Exception:
-            try:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    return (f.read(), None)
-            except Exception:
-                return ("", None)
-    except Exception:
-        return ("", None)
+            traceback.print_exc()
+    for path in paths[done:]:
+        try:
+            res = extract_file(path)
+        except Exception:
+            traceback.print_exc()
+            res = None
+        yield path, res
 
 
-def iter_sliding_windows(text: str, max_chars: int = 1200, overlap: int = 200) -> Iterable[str]:
+def iter_sliding_windows(text: str, max_chars: int = 1200, overlap: int = 200) -> Iterator[str]:
+    """Yield ~max_chars chunks of paragraphs, each starting with the last `overlap` chars of the previous one."""
     text = text.strip()
     if not text:
-        return []
+        return
+    step = max_chars - overlap
+    # Paragraphs of the current chunk and the length of their "\n\n" join, so the chunk is
+    # only built once, when it is emitted
+    parts: List[str] = []
+    size = 0
     # Try to keep paragraphs intact: split by double newline first.
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    if not paragraphs:
-        paragraphs = [text]
-
-    chunks: List[str] = []
-    buf = ""
-    for p in paragraphs:
-        if not buf:
-            buf = p
-        elif len(buf) + 2 + len(p) <= max_chars:
-            buf = f"{buf}\n\n{p}"
+    for p in text.split("\n\n"):
+        p = p.strip()
+        if not p:
+            continue
+        if not parts:
+            parts, size = [p], len(p)
+        elif size + 2 + len(p) <= max_chars:
+            parts.append(p)
+            size += 2 + len(p)
         else:
-            chunks.append(buf)
+            buf = "\n\n".join(parts)
+            yield buf
             # Sliding window overlap
             buf_tail = buf[-overlap:] if overlap > 0 else ""
             buf = (buf_tail + "\n\n" + p).strip()
             if len(buf) > max_chars:
                 # Hard wrap if single paragraph too large
-                for i in range(0, len(buf), max_chars - overlap):
-                    sub = buf[i:i + (max_chars - overlap)]
-                    if sub:
-                        chunks.append(sub)
-                buf = ""
-    if buf:
-        chunks.append(buf)
-    return chunks
+                for i in range(0, len(buf), step):
+                    yield buf[i:i + step]
+                parts, size = [], 0
+            else:
+                parts, size = [buf], len(buf)
+    if parts:
+        yield "\n\n".join(parts)
 
 
 @dataclass
@@ -183,7 +276,7 @@ class MetaEntry:
 
 
 class RAGIndex:
-    """Thin wrapper around FAISS IndexFlatIP plus JSONL sidecar metadata.
+    """Thin wrapper around FAISS IndexFlatIP plus SQLite sidecar metadata.
 
     - We store normalized vectors so inner product == cosine similarity.
     - We append-only for simplicity. Deletions are soft (meta.deleted = True).
@@ -193,6 +286,7 @@ class RAGIndex:
         self.dim = dim
         self.index = None
         self.model = None
+        self.db: Optional[sqlite3.Connection] = None
         self.size: int = 0  # number of vectors currently in the FAISS index
 
     def _lazy_model(self):
@@ -203,88 +297,121 @@ class RAGIndex:
             self.model = SentenceTransformer("all-MiniLM-L6-v2")
         return self.model
 
+    def _new_index(self):
+        """Empty index of the configured kind (LUMA_RAG_INDEX); inner product over normalized vectors."""
+        if get_rag_index_kind() == "hnsw":
+            # Graph search: sublinear query time for large corpora at near-exact recall
+            index = faiss.IndexHNSWFlat(self.dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            return index
+        if get_rag_index_kind() == "sq8":
+            # One byte per component. Vectors are unit-normalized, so every component lies in
+            # [-1, 1]; training on those bounds fixes the range without waiting for real data.
+            import numpy as np  # type: ignore
+            index = faiss.IndexScalarQuantizer(self.dim, faiss.ScalarQuantizer.QT_8bit_uniform, faiss.METRIC_INNER_PRODUCT)
+            index.train(np.array([[-1.0] * self.dim, [1.0] * self.dim], dtype="float32"))
+            return index
+        return faiss.IndexFlatIP(self.dim)
+
     def _lazy_index(self):
         if not HAVE_FAISS:
             raise RuntimeError("faiss not installed; install faiss-cpu to enable RAG")
         if self.index is None:
             if os.path.isfile(FAISS_PATH):
                 try:
+                    # write_index/read_index keep the index type, so an HNSW index stays HNSW
                     self.index = faiss.read_index(FAISS_PATH)
                     self.size = self.index.ntotal
                     return self.index
                 except Exception:
                     # Corrupt index; rebuild
-                    self.index = faiss.IndexFlatIP(self.dim)
+                    self.index = self._new_index()
                     self.size = 0
                     return self.index
-            self.index = faiss.IndexFlatIP(self.dim)
+            self.index = self._new_index()
             self.size = 0
         return self.index
 
-    def _normalize(self, X):
-        import numpy as np  # type: ignore
-        norms = np.linalg.norm(X, axis=1, keepdims=True) + 1e-12
-        return X / norms
+    def _lazy_db(self) -> sqlite3.Connection:
+        # Opened on first use so callers can still remove_meta() after constructing the index
+        if self.db is None:
+            self.db = connect_meta()
+        return self.db
 
     def _embed(self, texts: List[str]):
-        import numpy as np  # type: ignore
         model = self._lazy_model()
-        vecs = model.encode(texts, batch_size=64, show_progress_bar=False, convert_to_numpy=True)
-        vecs = self._normalize(vecs.astype("float32"))
-        return vecs
+        # The model normalizes its output tensor itself, so no extra pass over the vectors here
+        vecs = model.encode(texts, batch_size=EMBED_BATCH_SIZE, show_progress_bar=False, convert_to_numpy=True,
+                            normalize_embeddings=True)
+        return vecs.astype("float32", copy=False)
 
     def _append_meta(self, metas: List[MetaEntry]) -> None:
-        ensure_dirs()
-        temp_path = META_PATH + ".tmp"
-        with open(temp_path, "a", encoding="utf-8") as w:
-            for m in metas:
-                w.write(json.dumps(m.__dict__, ensure_ascii=False) + "\n")
-        # Atomic append: concatenate tmp to real and remove tmp
-        with open(temp_path, "r", encoding="utf-8") as r, open(META_PATH, "a", encoding="utf-8") as out:
-            out.write(r.read())
-        os.remove(temp_path)
+        db = self._lazy_db()
+        # One transaction per batch; REPLACE keeps the newest record if an id is reused
+        with db:
+            db.executemany("INSERT OR REPLACE INTO meta VALUES (?,?,?,?,?,?,?,?)",
+                           [_meta_row(m.__dict__) for m in metas])
 
     def _soft_delete_path(self, path: str) -> int:
-        """Mark existing entries with this path as deleted in-place by rewriting JSONL.
+        """Mark existing entries with this path as deleted (an indexed UPDATE).
         Returns number of entries marked.
         """
-        if not os.path.isfile(META_PATH):
-            return 0
-        temp = META_PATH + ".rewrite.tmp"
-        changed = 0
-        with open(META_PATH, "r", encoding="utf-8") as r, open(temp, "w", encoding="utf-8") as w:
-            for line in r:
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    continue
-                if obj.get("path") == path and not obj.get("deleted", False):
-                    obj["deleted"] = True
-                    changed += 1
-                w.write(json.dumps(obj, ensure_ascii=False) + "\n")
-        os.replace(temp, META_PATH)
-        return changed
+        db = self._lazy_db()
+        with db:
+            cur = db.execute("UPDATE meta SET deleted=1 WHERE path=? AND deleted=0", (path,))
+        return cur.rowcount
+
+    def _stored_sig(self, path: str) -> Optional[Tuple[int, int, str]]:
+        return self._lazy_db().execute(
+            "SELECT mtime_ns, size, content_sha1 FROM files WHERE path=?", (path,)).fetchone()
+
+    def _sigs_usable(self) -> bool:
+        # Signatures only vouch for vectors that are still there: after the index file was
+        # lost or found corrupt, every file has to be embedded again
+        try:
+            return self._lazy_index().ntotal > 0
+        except Exception:
+            return False
 
-    def index_file(self, path: str) -> Dict[str, int]:
-        """Index a single file. Replaces prior entries for this path via soft-delete.
+    def _is_unchanged(self, path: str, sig: Optional[Tuple[int, int]]) -> bool:
+        stored = self._stored_sig(path) if sig is not None else None
+        return stored is not None and tuple(stored[:2]) == sig
 
-        Returns a summary dict with counts.
+    def _record_sigs(self, rows: List[Tuple[str, int, int, str]]) -> None:
+        if rows:
+            with self._lazy_db() as db:
+                db.executemany("INSERT OR REPLACE INTO files VALUES (?,?,?,?)", rows)
+
+    def _prepare_file(self, path: str, extracted=False, sig=None) -> Tuple[int, List[MetaEntry], List[str], Optional[tuple]]:
+        """Soft-delete prior entries for this path and chunk its current text.
+
+        `extracted` is a precomputed extract_file(path) result (None means skip); by default
+        the file is extracted here. `sig` is file_sig(path) taken before extraction. Returns
+        (deleted, metas, texts, sig_row); meta ids are assigned when the chunks are added and
+        sig_row is recorded with _record_sigs once they are persisted.
         """
         ensure_dirs()
-        ext = os.path.splitext(path)[1].lower()
-        if (not INDEX_ALL_FILE_TYPES) and (ext not in SUPPORTED_EXTS):
-            return {"added": 0, "deleted": 0}
-        try:
-            st = os.stat(path)
-            mtime_iso = datetime.fromtimestamp(st.st_mtime).isoformat()
-        except Exception:
-            return {"added": 0, "deleted": 0}
+        if sig is None:
+            sig = file_sig(path)
+        if extracted is False:
+            extracted = extract_file(path)
+        if extracted is None or sig is None:
+            return 0, [], [], None
+        mtime_iso, full_text, paged = extracted
+        sig_row = (path, sig[0], sig[1], hashlib.sha1(full_text.encode("utf-8", "ignore")).hexdigest())
+
+        stored = self._stored_sig(path)
+        if stored is not None and stored[2] == sig_row[3] and self._sigs_usable():
+            # Touched but same text: keep the vectors, only refresh the timestamp used by filters
+            with self._lazy_db() as db:
+                db.execute("UPDATE meta SET mtime_iso=? WHERE path=? AND deleted=0", (mtime_iso, path))
+            return 0, [], [], sig_row
 
         deleted = self._soft_delete_path(path)
 
-        full_text, paged = load_text_from_file(path)
         if not full_text.strip():
-            return {"added": 0, "deleted": deleted}
+            return deleted, [], [], sig_row
 
         # Build chunks. If paged exists, chunk per page for better citation.
         entries: List[Tuple[Optional[int], str]] = []
@@ -298,9 +425,6 @@ class RAGIndex:
                 if chunk.strip():
                     entries.append((None, chunk))
 
-        if not entries:
-            return {"added": 0, "deleted": deleted}
-
         # Dedup by text_hash
         metas: List[MetaEntry] = []
         texts: List[str] = []
@@ -311,29 +435,57 @@ class RAGIndex:
             if h in seen:
                 continue
             seen.add(h)
-            metas.append(MetaEntry(id=self.size + len(texts), path=path, folder=folder, mtime_iso=mtime_iso,
+            metas.append(MetaEntry(id=-1, path=path, folder=folder, mtime_iso=mtime_iso,
                                    page=page, text_hash=h, text=chunk, deleted=False))
             texts.append(chunk)
+        return deleted, metas, texts, sig_row
 
-        if not texts:
-            return {"added": 0, "deleted": deleted}
+    def _add_chunks(self, metas: List[MetaEntry], texts: List[str]) -> int:
+        """Embed texts in one encode call, add them to the index and append their metadata.
 
+        Ids follow the index's current size (read from disk first if it exists), so they
+        stay aligned with FAISS vector order. The index itself is persisted by _write_index.
+        """
+        if not texts:
+            return 0
         vecs = self._embed(texts)
         index = self._lazy_index()
+        base = index.ntotal
+        for i, m in enumerate(metas):
+            m.id = base + i
         index.add(vecs)
         self.size = index.ntotal
+        self._append_meta(metas)
+        return len(texts)
 
-        # Persist index
+    def _write_index(self) -> None:
+        if not HAVE_FAISS or self.index is None:
+            return
         ensure_dirs()
         temp_index_path = FAISS_PATH + ".tmp"
-        if HAVE_FAISS:
-            faiss.write_index(index, temp_index_path)
-            os.replace(temp_index_path, FAISS_PATH)
+        faiss.write_index(self.index, temp_index_path)
+        os.replace(temp_index_path, FAISS_PATH)
 
-        # Append meta
-        self._append_meta(metas)
+    def index_file(self, path: str) -> Dict[str, int]:
+        """Index a single file. Replaces prior entries for this path via soft-delete.
 
-        return {"added": len(texts), "deleted": deleted}
+        Files whose size and mtime match the last indexing are skipped outright.
+        Returns a summary dict with counts.
+        """
+        sig = file_sig(path)
+        if sig is None:
+            # Gone: forget its signature so a file reappearing at this path is indexed again
+            with self._lazy_db() as db:
+                db.execute("DELETE FROM files WHERE path=?", (path,))
+        elif self._is_unchanged(path, sig) and self._sigs_usable():
+            return {"added": 0, "deleted": 0, "skipped": 1}
+        deleted, metas, texts, sig_row = self._prepare_file(path, sig=sig)
+        added = self._add_chunks(metas, texts)
+        if added:
+            self._write_index()
+        if sig_row is not None:
+            self._record_sigs([sig_row])
+        return {"added": added, "deleted": deleted, "skipped": 0}
 
     def index_folders(self, folders: List[str], excludes: Optional[List[str]] = None, progress_cb: Optional[callable] = None) -> Dict[str, int]:
         """Recursively index supported files in given folders, respecting excludes.
@@ -343,40 +495,60 @@ class RAGIndex:
         """
         excludes = excludes or []
         # Pre-scan to compute total files for progress reporting
-        file_list: List[str] = []
-        for root in folders:
-            if not os.path.isdir(root):
-                continue
-            for dirpath, dirnames, filenames in os.walk(root):
-                dirnames[:] = [d for d in dirnames if not d.startswith('.') and not any(x in d for x in excludes)]
-                for fn in filenames:
-                    if fn.startswith('.'):
-                        continue
-                    path = os.path.join(dirpath, fn)
-                    if INDEX_ALL_FILE_TYPES:
-                        file_list.append(path)
-                    else:
-                        ext = os.path.splitext(path)[1].lower()
-                        if ext in SUPPORTED_EXTS:
-                            file_list.append(path)
-
-        total = len(file_list)
-        processed = 0
+        sigs: Dict[str, Optional[Tuple[int, int]]] = dict(iter_files(folders, excludes))
+
+        total = len(sigs)
         added = 0
         deleted = 0
 
+        # Files with the same size and mtime as when they were last indexed are skipped before
+        # extraction; they count as processed straight away
+        use_sigs = self._sigs_usable()
+        todo: List[str] = []
+        for path, sig in sigs.items():
+            if not (use_sigs and self._is_unchanged(path, sig)):
+                todo.append(path)
+        skipped = total - len(todo)
+        processed = skipped
+
         # Emit initial progress
         try:
             if progress_cb:
-                progress_cb(0, total, "")
+                progress_cb(processed, total, "")
         except Exception:
             pass
 
-        for path in file_list:
+        # Chunks from many files share one encode call, one index.add and one meta append;
+        # the index file is written once at the end instead of after every file
+        pending_metas: List[MetaEntry] = []
+        pending_texts: List[str] = []
+        pending_sigs: List[tuple] = []
+        # Signatures of files whose chunks were added; recorded only after the index is written
+        done_sigs: List[tuple] = []
+
+        def _flush() -> int:
+            try:
+                n = self._add_chunks(pending_metas, pending_texts)
+                done_sigs.extend(pending_sigs)
+                return n
+            except Exception:
+                traceback.print_exc()
+                return 0
+            finally:
+                pending_metas.clear()
+                pending_texts.clear()
+                pending_sigs.clear()
+
+        for path, extracted in iter_extracted(todo):
             try:
-                res = self.index_file(path)
-                added += res.get("added", 0)
-                deleted += res.get("deleted", 0)
+                d, metas, texts, sig_row = self._prepare_file(path, extracted, sigs[path])
+                deleted += d
+                pending_metas.extend(metas)
+                pending_texts.extend(texts)
+                if sig_row is not None:
+                    pending_sigs.append(sig_row)
+                if len(pending_texts) >= INDEX_BATCH_CHUNKS:
+                    added += _flush()
             except Exception:
                 # Keep indexing even if a file fails
                 traceback.print_exc()
@@ -388,19 +560,28 @@ class RAGIndex:
                 except Exception:
                     pass
 
-        return {"added": added, "deleted": deleted}
+        added += _flush()
+        try:
+            self._write_index()
+            self._record_sigs(done_sigs)
+        except Exception:
+            traceback.print_exc()
+
+        return {"added": added, "deleted": deleted, "skipped": skipped}
 
 
 def read_meta_lines() -> Iterable[Dict[str, object]]:
-    if not os.path.isfile(META_PATH):
+    """Live (not deleted) metadata records as dicts, in id order."""
+    if not os.path.isfile(META_PATH) and not os.path.isfile(LEGACY_META_PATH):
         return []
     def _iter():
-        with open(META_PATH, "r", encoding="utf-8") as r:
-            for line in r:
-                try:
-                    yield json.loads(line)
-                except Exception:
-                    continue
+        db = connect_meta()
+        try:
+            cur = db.execute("SELECT %s FROM meta WHERE deleted=0 ORDER BY id" % ", ".join(META_COLUMNS))
+            for row in cur:
+                obj = dict(zip(META_COLUMNS, row))
+                obj["deleted"] = False
+                yield obj
+        finally:
+            db.close()
     return _iter()
-
-
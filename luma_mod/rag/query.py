@@ -1,6 +1,7 @@
 from __future__ import annotations
 import os
 import json
+import threading
 from datetime import datetime
 from typing import List, Optional, Tuple, Dict, Iterable
 
@@ -11,7 +12,6 @@ except Exception:
     faiss = None  # type: ignore
     HAVE_FAISS = False
 
-import numpy as np  # type: ignore
 try:
     from sentence_transformers import SentenceTransformer  # type: ignore
     HAVE_ST = True
@@ -19,29 +19,81 @@ except Exception:
     SentenceTransformer = None  # type: ignore
     HAVE_ST = False
 
-from .indexer import RAG_HOME, FAISS_PATH, META_PATH, read_meta_lines
+from ..config import get_faiss_gpu_enabled
+from .indexer import RAG_HOME, FAISS_PATH, META_PATH, HNSW_EF_SEARCH, read_meta_lines
+
+
+# Loaded once per process and shared by every search; the index is re-read only when the
+# file on disk changes (an index run or the watcher rewrote it)
+_LOCK = threading.Lock()
+_INDEX_CACHE = None
+_INDEX_SIG = None  # (st_mtime_ns, st_size) of FAISS_PATH when _INDEX_CACHE was read
+_MODEL_CACHE = None
+_GPU_RES = None  # faiss.StandardGpuResources, created on first GPU use and kept
+
+# Scratch memory FAISS reserves on the GPU for searches
+GPU_TEMP_MEMORY = 64 * 1024 * 1024
+
+
+def _to_gpu(index):
+    """Copy the index to GPU 0 when LUMA_FAISS_GPU is set and FAISS can see a GPU.
+
+    Falls back to the CPU index for CPU-only builds and for index types without a GPU
+    implementation (HNSW).
+    """
+    global _GPU_RES
+    if not get_faiss_gpu_enabled():
+        return index
+    try:
+        if not hasattr(faiss, "index_cpu_to_gpu") or faiss.get_num_gpus() < 1:
+            return index
+        if _GPU_RES is None:
+            _GPU_RES = faiss.StandardGpuResources()
+            _GPU_RES.setTempMemory(GPU_TEMP_MEMORY)
+        return faiss.index_cpu_to_gpu(_GPU_RES, 0, index)
+    except Exception:
+        return index
 
 
 def _lazy_index():
+    global _INDEX_CACHE, _INDEX_SIG
     if not HAVE_FAISS:
         return None
-    if not os.path.isfile(FAISS_PATH):
-        return None
     try:
-        return faiss.read_index(FAISS_PATH)
-    except Exception:
+        st = os.stat(FAISS_PATH)
+    except OSError:
         return None
+    sig = (st.st_mtime_ns, st.st_size)
+    with _LOCK:
+        if _INDEX_SIG != sig:
+            try:
+                _INDEX_CACHE = faiss.read_index(FAISS_PATH)
+                # HNSW (LUMA_RAG_INDEX=hnsw): query beam width from the current setting, not
+                # whatever the file was saved with
+                hnsw = getattr(_INDEX_CACHE, "hnsw", None)
+                if hnsw is not None:
+                    hnsw.efSearch = HNSW_EF_SEARCH
+                _INDEX_CACHE = _to_gpu(_INDEX_CACHE)
+            except Exception:
+                _INDEX_CACHE = None
+            _INDEX_SIG = sig
+        return _INDEX_CACHE
 
 
 def _lazy_model():
+    global _MODEL_CACHE
     if not HAVE_ST:
         return None
-    return SentenceTransformer("all-MiniLM-L6-v2")
+    with _LOCK:
+        if _MODEL_CACHE is None:
+            _MODEL_CACHE = SentenceTransformer("all-MiniLM-L6-v2")
+        return _MODEL_CACHE
 
 
-def _normalize(X: np.ndarray) -> np.ndarray:
-    norms = np.linalg.norm(X, axis=1, keepdims=True) + 1e-12
-    return X / norms
+def warmup() -> None:
+    """Load the index and embedding model ahead of the first question, if an index exists."""
+    if _lazy_index() is not None:
+        _lazy_model()
 
 
 def _prefilter_meta(items: Iterable[Dict[str, object]], folder: Optional[str], time_from: Optional[str], time_to: Optional[str], prefilter_paths: Optional[List[str]]) -> List[Dict[str, object]]:
@@ -69,41 +121,52 @@ def _prefilter_meta(items: Iterable[Dict[str, object]], folder: Optional[str], t
 
 
 def search(query: str, k: int = 20, folder: Optional[str] = None, time_from: Optional[str] = None, time_to: Optional[str] = None, prefilter_paths: Optional[List[str]] = None) -> List[Tuple[float, Dict[str, object]]]:
+    return search_batch([query], k, folder, time_from, time_to, prefilter_paths)[0]
+
+
+def search_batch(queries: List[str], k: int = 20, folder: Optional[str] = None, time_from: Optional[str] = None, time_to: Optional[str] = None, prefilter_paths: Optional[List[str]] = None) -> List[List[Tuple[float, Dict[str, object]]]]:
+    """search() for several queries at once: one encode call, one meta read and one FAISS
+    search over all query vectors (FAISS parallelizes across the rows of a batch).
+
+    Returns one hit list per query, in order.
+    """
+    empty: List[List[Tuple[float, Dict[str, object]]]] = [[] for _ in queries]
+    if not queries:
+        return empty
     index = _lazy_index()
     if index is None or index.ntotal == 0:
-        return []
+        return empty
     model = _lazy_model()
     if model is None:
-        return []
-    qv = model.encode([query], convert_to_numpy=True)
-    qv = _normalize(qv.astype("float32"))
+        return empty
+    qv = model.encode(list(queries), convert_to_numpy=True, normalize_embeddings=True).astype("float32", copy=False)
 
-    # We need to map meta row order to FAISS vector order: meta.jsonl is append-only aligned with index addition order.
+    # We need to map meta row order to FAISS vector order: meta ids are assigned in index addition order.
     metas_all = list(read_meta_lines())
     metas = list(_prefilter_meta(metas_all, folder, time_from, time_to, prefilter_paths))
     # If prefilter wiped everything but we do have data, back off to local-folder heuristic using the query terms
     if not metas and prefilter_paths:
         metas = list(_prefilter_meta(metas_all, folder, time_from, time_to, None))
     if not metas:
-        return []
+        return empty
 
     # FAISS search over all vectors, then filter to top-k of metas via scores join.
     D, I = index.search(qv, min(k * 5, max(50, k * 3)))  # wider search then filter
-    candidates: List[Tuple[int, float]] = []
+    # Join with metas by vector id (stored under 'id') and filter deleted
+    meta_by_id = {int(m.get("id")): m for m in metas}
+    return [_join_hits(ids, scores, meta_by_id, k) for ids, scores in zip(I.tolist(), D.tolist())]
+
+
+def _join_hits(ids: List[int], scores: List[float], meta_by_id: Dict[int, Dict[str, object]], k: int) -> List[Tuple[float, Dict[str, object]]]:
+    hits: List[Tuple[float, Dict[str, object]]] = []
     seen_ids: set[int] = set()
-    for idx, score in zip(I[0].tolist(), D[0].tolist()):
+    for idx, score in zip(ids, scores):
         if idx in seen_ids:
             continue
         seen_ids.add(idx)
         # Guard index range
         if idx < 0:
             continue
-        candidates.append((idx, float(score)))
-
-    # Join with metas by vector id (stored under 'id') and filter deleted
-    meta_by_id = {int(m.get("id")): m for m in metas}
-    hits: List[Tuple[float, Dict[str, object]]] = []
-    for idx, score in candidates:
         m = meta_by_id.get(idx)
         if not m:
             continue
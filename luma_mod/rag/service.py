@@ -33,11 +33,10 @@ def ensure_index_started(
         # Hard reset: remove existing index and meta
         try:
             import os
-            from .indexer import FAISS_PATH, META_PATH
+            from .indexer import FAISS_PATH, remove_meta
             if os.path.exists(FAISS_PATH):
                 os.remove(FAISS_PATH)
-            if os.path.exists(META_PATH):
-                os.remove(META_PATH)
+            remove_meta()
             # Recreate empty index lazily on first add
         except Exception:
             pass
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QMouseEvent, QKeyEvent
+from urllib.parse import quote, unquote
+
+from PyQt6.QtCore import Qt, QUrl, QRectF
+from PyQt6.QtGui import QMouseEvent, QKeyEvent, QPainter, QPixmap
 from PyQt6.QtWidgets import QTextBrowser
 
 
+# <img src="glyph:..."> is rendered by ChatBrowser from the (percent-encoded) text itself
+GLYPH_SCHEME = "glyph"
+GLYPH_SIZE = 16  # logical pixels
+
+
+def glyph_img(text: str) -> str:
+    """HTML for an emoji/icon glyph drawn once per browser and reused as an image."""
+    return f"<img src='{GLYPH_SCHEME}:{quote(text)}' width='{GLYPH_SIZE}' height='{GLYPH_SIZE}'>"
+
+
 class ChatBrowser(QTextBrowser):
     """Custom QTextBrowser that can handle clicks on file/folder links."""
 
@@ -13,12 +25,36 @@ class ChatBrowser(QTextBrowser):
         self.setOpenLinks(False)
         self.setOpenExternalLinks(False)
         self.setReadOnly(True)
+        # Read-only transcript: keeping an undo stack only copies every inserted fragment
+        self.document().setUndoRedoEnabled(False)
         self.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
             | Qt.TextInteractionFlag.LinksAccessibleByMouse
         )
         self.anchorClicked.connect(self._on_anchor_clicked)
         self._current_focused_element = None
+        # glyph text -> rasterized pixmap, so each distinct emoji is shaped once, not once per row
+        self._glyphs: dict = {}
+
+    def loadResource(self, type: int, name: QUrl):
+        """Serve glyph: images; never fetch other <img>/stylesheet resources."""
+        if name.scheme() == GLYPH_SCHEME:
+            return self._glyph_pixmap(unquote(name.path(QUrl.ComponentFormattingOption.FullyEncoded)))
+        return None
+
+    def _glyph_pixmap(self, text: str) -> QPixmap:
+        pm = self._glyphs.get(text)
+        if pm is None:
+            dpr = self.devicePixelRatioF()
+            pm = QPixmap(round(GLYPH_SIZE * dpr), round(GLYPH_SIZE * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pm)
+            font = p.font(); font.setPixelSize(12); p.setFont(font)
+            p.drawText(QRectF(0, 0, GLYPH_SIZE, GLYPH_SIZE), Qt.AlignmentFlag.AlignCenter, text)
+            p.end()
+            self._glyphs[text] = pm
+        return pm
 
     def _on_anchor_clicked(self, url: QUrl):
         """Handle single-click on links."""
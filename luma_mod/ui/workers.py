@@ -1,14 +1,64 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QRunnable, QThreadPool, pyqtSignal
 
 from ..ai import LumaAI
 from ..search_core import search_files
 from ..models import FileHit
 
 
+# Rerank/summarize/Q&A jobs share this many pooled threads; a burst of reranks while
+# typing queues up (and cancelled ones are skipped) instead of each getting a new QThread
+AI_POOL_THREADS = 2
+
+_ai_pool: Optional[QThreadPool] = None
+
+
+def ai_pool() -> QThreadPool:
+    """Thread pool for the short AI jobs, created on first use."""
+    global _ai_pool
+    if _ai_pool is None:
+        # Parented to the app so it is torn down (and waited for) before Qt shuts down
+        _ai_pool = QThreadPool(QCoreApplication.instance())
+        _ai_pool.setMaxThreadCount(AI_POOL_THREADS)
+    return _ai_pool
+
+
+class _PooledJob(QRunnable):
+    def __init__(self, worker: "PooledWorker"):
+        super().__init__()
+        self.worker = worker  # keeps the signal carrier alive until run() is done
+        self.setAutoDelete(True)
+
+    def run(self):
+        if not self.worker.cancelled:
+            self.worker.run()
+
+
+class PooledWorker(QObject):
+    """Signal carrier for a job that runs on ai_pool().
+
+    Subclasses declare signals and implement run(); start() keeps the QThread-style call
+    sites unchanged. cancel() drops a job that has not started yet and stops a running
+    one from emitting once it checks `cancelled`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = False
+
+    def start(self):
+        ai_pool().start(_PooledJob(self))
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        """The job body, called on a pool thread; subclasses override it. Does nothing here."""
+
+
 class SearchWorker(QThread):
     results_ready = pyqtSignal(list)
 
@@ -42,6 +92,8 @@ class SearchWorker(QThread):
             self.semantic_keywords,
             self.file_patterns,
         ):
+            if self.isInterruptionRequested():
+                return
             try:
                 from os import stat
 
@@ -69,7 +121,7 @@ class AIWorker(QThread):
         self.info_ready.emit(info)
 
 
-class RerankWorker(QThread):
+class RerankWorker(PooledWorker):
     reranked = pyqtSignal(list)
 
     def __init__(
@@ -93,6 +145,8 @@ class RerankWorker(QThread):
         try:
             paths = [h.path for h in self.hits][:30]
             scores = self.ai.rerank_by_name(self.query, paths, self.time_window, self.file_types, self.folders) or {}
+            if self.cancelled:
+                return  # superseded by a newer search while the model was busy
             if not scores:
                 self.reranked.emit(self.hits)
                 return
@@ -104,10 +158,11 @@ class RerankWorker(QThread):
             new_hits = sorted([boosted(h) for h in self.hits], key=lambda x: x.score, reverse=True)
             self.reranked.emit(new_hits)
         except Exception:
-            self.reranked.emit(self.hits)
+            if not self.cancelled:
+                self.reranked.emit(self.hits)
 
 
-class SummarizeWorker(QThread):
+class SummarizeWorker(PooledWorker):
     summary_ready = pyqtSignal(str)
     summary_failed = pyqtSignal(str)
 
@@ -135,7 +190,7 @@ class SummarizeWorker(QThread):
             self.summary_failed.emit(f"Summary failed: {str(e)}")
 
 
-class QnAWorker(QThread):
+class QnAWorker(PooledWorker):
     answer_ready = pyqtSignal(str)
 
     def __init__(self, ai: LumaAI, path: str, question: str):
@@ -152,14 +207,37 @@ class QnAWorker(QThread):
         self.answer_ready.emit(a)
 
 
-class WarmupWorker(QThread):
-    def __init__(self, ai: LumaAI):
+class WarmupWorker(QRunnable):
+    """Fire-and-forget model warmup, run on the global QThreadPool.
+
+    Nothing on the GUI side waits for it, so a pooled runnable avoids creating
+    (and having to keep alive) a fresh QThread on every mode switch.
+    """
+
+    def __init__(self, ai: LumaAI, on_failure: Optional[Callable[[], None]] = None):
         super().__init__()
         self.ai = ai
+        # Called from the pool thread when warmup does not succeed
+        self.on_failure = on_failure
+        self.setAutoDelete(True)
+
+    def start(self):
+        QThreadPool.globalInstance().start(self)
 
     def run(self):
         try:
-            self.ai.warmup()
+            ok = self.ai.warmup()
+        except Exception:
+            ok = False
+        if not ok and self.on_failure is not None:
+            try:
+                self.on_failure()
+            except Exception:
+                pass
+        # Same for local RAG: the first question would otherwise pay the model/index load
+        try:
+            from luma_mod.rag.query import warmup as rag_warmup
+            rag_warmup()
         except Exception:
             pass
 
@@ -178,15 +256,14 @@ class IndexWorker(QThread):
     def run(self):
         try:
             # Lazy imports to avoid heavy deps on UI thread
-            from luma_mod.rag.indexer import RAGIndex, FAISS_PATH, META_PATH
+            from luma_mod.rag.indexer import RAGIndex, FAISS_PATH, remove_meta
             import os as _os
 
             if self.replace:
                 try:
                     if _os.path.exists(FAISS_PATH):
                         _os.remove(FAISS_PATH)
-                    if _os.path.exists(META_PATH):
-                        _os.remove(META_PATH)
+                    remove_meta()
                 except Exception:
                     pass
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os, tempfile, shutil, subprocess
+from collections import OrderedDict
 from typing import Optional
 
 from PyQt6.QtCore import Qt, QTimer, QFileInfo, QThread, pyqtSignal
@@ -28,6 +29,9 @@ try:
 except Exception:
     HAVE_PIL = False
 
+# Rendered thumbnails kept per (path, mtime) so revisiting a result skips the worker
+PREVIEW_CACHE_SIZE = 32
+
 
 class PreviewWorker(QThread):
     """Worker thread for generating file previews to prevent UI blocking."""
@@ -238,6 +242,8 @@ class PreviewPane(QWidget):
         self.setObjectName("previewPane")
         # Remove individual styling - let the main UI CSS handle it
         self._current_worker: Optional[PreviewWorker] = None
+        self._preview_cache: "OrderedDict[tuple, tuple[QPixmap, str]]" = OrderedDict()
+        self._preview_key: Optional[tuple] = None
         root = QVBoxLayout(self); root.setContentsMargins(24,12,24,12)
         top = QHBoxLayout(); top.setSpacing(24)
 
@@ -319,12 +325,14 @@ class PreviewPane(QWidget):
         for _,v in self._rows: v.setText("—")
         self.summary.clear(); self.summary.setVisible(False); self.btn_summarize.setVisible(False)
         self._current_file = path  # Store current file path
+        self._preview_key = None
         if not path: return
         
+        ext = os.path.splitext(path)[1].lower()
         try:
             from os import stat
             st = stat(path)
-            ext = os.path.splitext(path)[1].lower()
+            self._preview_key = (path, st.st_mtime)
             self.v_name.setText(os.path.basename(path))
             self.v_where.setText(elide_middle(os.path.dirname(path) or path, 80))
             self.v_type.setText(ext_to_type(ext))
@@ -335,14 +343,19 @@ class PreviewPane(QWidget):
         except Exception:
             self.v_where.setText(elide_middle(path,80))
 
-        # Start preview generation in worker thread
-        self._current_worker = PreviewWorker(path, ext)
-        self._current_worker.preview_ready.connect(self._on_preview_ready)
-        self._current_worker.preview_failed.connect(self._on_preview_failed)
-        self._current_worker.start()
-        
-        # Show loading message
-        self.thumb.setText(tr("loading_preview"))
+        cached = self._preview_cache.get(self._preview_key) if self._preview_key else None
+        if cached is not None:
+            self._preview_cache.move_to_end(self._preview_key)
+            self._set_thumb(cached[0]); self._orig_orientation = cached[1]
+        else:
+            # Start preview generation in worker thread
+            self._current_worker = PreviewWorker(path, ext)
+            self._current_worker.preview_ready.connect(self._on_preview_ready)
+            self._current_worker.preview_failed.connect(self._on_preview_failed)
+            self._current_worker.start()
+            
+            # Show loading message
+            self.thumb.setText(tr("loading_preview"))
         
         # Show summarize header/button only for text-like types AND when AI mode is enabled
         can_summarize = ((ext in TEXT_EXTS) or (ext in {".pdf",".docx",".pptx"})) and ai_mode != "none"
@@ -355,11 +368,19 @@ class PreviewPane(QWidget):
     
     def _on_preview_ready(self, path: str, pixmap: QPixmap, orientation: str):
         """Handle successful preview generation."""
+        if path != self._current_file:
+            return  # a worker for a previously selected file finished late
         self._set_thumb(pixmap)
         self._orig_orientation = orientation
+        if self._preview_key is not None and not pixmap.isNull():
+            self._preview_cache[self._preview_key] = (pixmap, orientation)
+            if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
     
     def _on_preview_failed(self, path: str, error_message: str):
         """Handle failed preview generation."""
+        if path != self._current_file:
+            return
         self.thumb.setText(f"{tr('preview_failed')}: {error_message}")
 
     def update_summarize_button_visibility(self, ai_mode: str):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import json
 import tempfile
 
 from luma_mod.rag.indexer import iter_sliding_windows, RAGIndex
@@ -22,3 +23,97 @@ def test_build_prompt_shapes():
     assert "[1]" in usr and "[2]" in usr
 
 
+def _use_tmp_store(monkeypatch, tmp_path):
+    from luma_mod.rag import indexer
+    monkeypatch.setattr(indexer, "RAG_HOME", str(tmp_path))
+    monkeypatch.setattr(indexer, "META_PATH", str(tmp_path / "meta.db"))
+    monkeypatch.setattr(indexer, "LEGACY_META_PATH", str(tmp_path / "meta.jsonl"))
+    return indexer
+
+
+def test_legacy_meta_jsonl_is_imported(monkeypatch, tmp_path):
+    indexer = _use_tmp_store(monkeypatch, tmp_path)
+    rows = [
+        {"id": 0, "path": "/a.txt", "folder": "f", "mtime_iso": "2024-01-01T00:00:00", "page": None, "text_hash": "h0", "text": "old", "deleted": True},
+        {"id": 1, "path": "/b.pdf", "folder": "f", "mtime_iso": "2024-01-01T00:00:00", "page": 2, "text_hash": "h1", "text": "café", "deleted": False},
+        {"id": 2, "path": "/a.txt", "folder": "f", "mtime_iso": "2024-01-02T00:00:00", "page": None, "text_hash": "h2", "text": "new", "deleted": False},
+    ]
+    with open(indexer.LEGACY_META_PATH, "w", encoding="utf-8") as f:
+        for r in rows:
+            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        f.write("not json\n")
+
+    live = list(indexer.read_meta_lines())
+    assert [m["id"] for m in live] == [1, 2]
+    assert live[0]["text"] == "café" and live[0]["page"] == 2
+    assert not os.path.exists(indexer.LEGACY_META_PATH)
+    db = indexer.connect_meta()
+    try:
+        assert db.execute("SELECT deleted FROM meta WHERE id=0").fetchone() == (1,)
+    finally:
+        db.close()
+
+
+def test_meta_store_reopen_is_idempotent(monkeypatch, tmp_path):
+    indexer = _use_tmp_store(monkeypatch, tmp_path)
+    idx = indexer.RAGIndex()
+    idx._append_meta([indexer.MetaEntry(id=0, path="/a.txt", folder="f", mtime_iso="t", page=None, text_hash="h", text="x")])
+    idx.db.close()
+    for _ in range(2):
+        db = indexer.connect_meta()
+        db.close()
+    assert [m["id"] for m in indexer.read_meta_lines()] == [0]
+    assert indexer.RAGIndex()._soft_delete_path("/a.txt") == 1
+    assert list(indexer.read_meta_lines()) == []
+
+
+def test_remove_meta_clears_store_for_replace(monkeypatch, tmp_path):
+    indexer = _use_tmp_store(monkeypatch, tmp_path)
+    idx = indexer.RAGIndex()
+    idx._append_meta([indexer.MetaEntry(id=0, path="/a.txt", folder="f", mtime_iso="t", page=None, text_hash="h", text="x")])
+    idx.db.close()
+    open(indexer.LEGACY_META_PATH, "w").close()
+    indexer.remove_meta()
+    assert os.listdir(tmp_path) == []
+    assert list(indexer.read_meta_lines()) == []
+
+
+class _FakeIndex:
+    ntotal = 0
+
+    def add(self, vecs):
+        self.ntotal += len(vecs)
+
+
+def test_unchanged_files_are_skipped(monkeypatch, tmp_path):
+    indexer = _use_tmp_store(monkeypatch, tmp_path / "db")
+    extracted = []
+    real_extract = indexer.extract_file
+    monkeypatch.setattr(indexer, "extract_file", lambda p: extracted.append(p) or real_extract(p))
+    monkeypatch.setattr(indexer.RAGIndex, "_lazy_index", lambda self: self.index)
+    monkeypatch.setattr(indexer.RAGIndex, "_embed", lambda self, texts: [[0.0]] * len(texts))
+    monkeypatch.setattr(indexer.RAGIndex, "_write_index", lambda self: None)
+    idx = indexer.RAGIndex()
+    idx.index = _FakeIndex()
+
+    doc = tmp_path / "doc.txt"
+    doc.write_text("first paragraph\n\nsecond paragraph")
+    assert idx.index_file(str(doc))["added"] == 1
+    assert len(extracted) == 1
+
+    # Untouched: neither extracted nor embedded again
+    assert idx.index_file(str(doc)) == {"added": 0, "deleted": 0, "skipped": 1}
+    assert len(extracted) == 1
+
+    # New mtime forces extraction (same text: the vectors are kept)
+    st = os.stat(doc)
+    os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert idx.index_file(str(doc))["skipped"] == 0
+    assert len(extracted) == 2
+
+    # New size forces extraction and replaces the old chunks
+    doc.write_text("first paragraph\n\nsecond paragraph\n\nthird")
+    res = idx.index_file(str(doc))
+    assert len(extracted) == 3
+    assert res["added"] == 1 and res["deleted"] == 1
+    assert idx.index_file(str(doc))["skipped"] == 1